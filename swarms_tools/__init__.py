@@ -2,5 +2,30 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
-from swarms_tools.search import *
-from swarms_tools.structs import *
+from swarms_tools.structs import *  # noqa: E402,F401,F403
+from swarms_tools.structs import __all__ as _structs_all
+from swarms_tools import search as _search
+
+# Search tools are re-exported lazily (PEP 562): a star-import
+# here would resolve every name in search's __all__ through its
+# __getattr__ and eagerly import all of the search submodules —
+# exactly the cost the lazy table exists to avoid. Attribute
+# access delegates instead, so a submodule is only imported when
+# one of its tools is first touched.
+__all__ = [*_search.__all__, *_structs_all]
+
+
+def __getattr__(name: str):
+    try:
+        value = getattr(_search, name)
+    except AttributeError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+    # Cache so subsequent lookups skip __getattr__ entirely.
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
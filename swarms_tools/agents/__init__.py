@@ -0,0 +1,5 @@
+from swarms_tools.agents.attps import ATTPsVerify
+
+__all__ = [
+    "ATTPsVerify",
+]
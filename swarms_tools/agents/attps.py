@@ -0,0 +1,202 @@
+"""ATTPs verification tool built on the APRO ATTPs SDK.
+
+This module wraps the `attps` SDK so swarms agents can register
+themselves on-chain and verify agent message payloads. Single-item
+calls submit one transaction synchronously; the batch APIs fan the
+submissions out concurrently so N registrations/verifications cost
+roughly one round-trip instead of N.
+"""
+
+import asyncio
+from typing import Any, List, Optional, Tuple
+
+from attps.verify.agent import AgentSDK
+from attps.verify.entities import (
+    AgentMessagePayload,
+    AgentSettings,
+)
+from loguru import logger
+
+
+class ATTPsVerify:
+    """High-level client for ATTPs agent registration and verification.
+
+    Args:
+        endpoint_uri: JSON-RPC endpoint of the target network.
+        proxy_address: Address of the deployed agent proxy contract.
+        transmitter_private_keys: Private keys for the transmitter
+            accounts used to sign and submit transactions.
+    """
+
+    def __init__(
+        self,
+        endpoint_uri: str,
+        proxy_address: str,
+        transmitter_private_keys: Optional[List[str]] = None,
+    ):
+        self.agent = AgentSDK(
+            endpoint_uri=endpoint_uri,
+            proxy_address=proxy_address,
+        )
+        for private_key in transmitter_private_keys or []:
+            self.agent.add_account(private_key)
+
+    def transmitters(self) -> List[str]:
+        """Return the transmitter addresses registered on the SDK."""
+        return self.agent.transmitters()
+
+    def register_agent(
+        self,
+        transmitter: str,
+        settings: AgentSettings,
+        nonce: Optional[int] = None,
+    ) -> Any:
+        """Register a single agent on-chain.
+
+        Args:
+            transmitter: Address submitting the transaction.
+            settings: Agent configuration to register.
+            nonce: Optional explicit transaction nonce.
+
+        Returns:
+            The SDK registration result (transaction hash etc.).
+        """
+        return self.agent.create_and_register_agent(
+            transmitter=transmitter,
+            nonce=nonce,
+            settings=settings,
+        )
+
+    def verify(
+        self,
+        transmitter: str,
+        agent_contract: str,
+        settings_digest: str,
+        payload: AgentMessagePayload,
+        nonce: Optional[int] = None,
+    ) -> Any:
+        """Verify a single agent message payload on-chain.
+
+        Args:
+            transmitter: Address submitting the transaction.
+            agent_contract: Verification contract for the agent.
+            settings_digest: Digest identifying the agent settings.
+            payload: Signed message payload to verify.
+            nonce: Optional explicit transaction nonce.
+
+        Returns:
+            The SDK verification result (transaction hash etc.).
+        """
+        return self.agent.verify(
+            transmitter=transmitter,
+            nonce=nonce,
+            agent_contract=agent_contract,
+            settings_digest=settings_digest,
+            payload=payload,
+        )
+
+    async def register_agent_async(
+        self,
+        transmitter: str,
+        settings: AgentSettings,
+        nonce: Optional[int] = None,
+    ) -> Any:
+        """Async wrapper for :meth:`register_agent`.
+
+        The SDK is synchronous, so the call is pushed to a worker
+        thread; many of these can then run concurrently.
+        """
+        return await asyncio.to_thread(
+            self.register_agent, transmitter, settings, nonce
+        )
+
+    async def verify_async(
+        self,
+        transmitter: str,
+        agent_contract: str,
+        settings_digest: str,
+        payload: AgentMessagePayload,
+        nonce: Optional[int] = None,
+    ) -> Any:
+        """Async wrapper for :meth:`verify`."""
+        return await asyncio.to_thread(
+            self.verify,
+            transmitter,
+            agent_contract,
+            settings_digest,
+            payload,
+            nonce,
+        )
+
+    def register_agents_batch(
+        self,
+        items: List[Tuple[str, AgentSettings]],
+    ) -> List[Any]:
+        """Register many agents concurrently.
+
+        Submits every registration at once instead of paying one
+        round-trip per agent, so wall time is bounded by the slowest
+        single submission.
+
+        Args:
+            items: List of ``(transmitter, settings)`` pairs.
+
+        Returns:
+            One result per item, in input order. Failed submissions
+            are returned as the raised exception instead of a result.
+        """
+
+        async def _run() -> List[Any]:
+            return await asyncio.gather(
+                *(
+                    self.register_agent_async(
+                        transmitter, settings
+                    )
+                    for transmitter, settings in items
+                ),
+                return_exceptions=True,
+            )
+
+        logger.debug(
+            f"Submitting batch of {len(items)} agent registrations"
+        )
+        return asyncio.run(_run())
+
+    def verify_batch(
+        self,
+        items: List[Tuple[str, str, str, AgentMessagePayload]],
+    ) -> List[Any]:
+        """Verify many agent message payloads concurrently.
+
+        Args:
+            items: List of ``(transmitter, agent_contract,
+                settings_digest, payload)`` tuples.
+
+        Returns:
+            One result per item, in input order. Failed submissions
+            are returned as the raised exception instead of a result.
+        """
+
+        async def _run() -> List[Any]:
+            return await asyncio.gather(
+                *(
+                    self.verify_async(
+                        transmitter,
+                        agent_contract,
+                        settings_digest,
+                        payload,
+                    )
+                    for (
+                        transmitter,
+                        agent_contract,
+                        settings_digest,
+                        payload,
+                    ) in items
+                ),
+                return_exceptions=True,
+            )
+
+        logger.debug(
+            f"Submitting batch of {len(items)} verifications"
+        )
+        return asyncio.run(_run())
@@ -1,17 +1,155 @@
-from swarms_tools.search.exa_search import exa_search
-from swarms_tools.search.web_scraper import (
-    scrape_and_format_sync,
-    scrape_multiple_urls_sync,
-)
-from swarms_tools.search.firecrawl import crawl_entire_site_firecrawl
-from swarms_tools.search.self_evolve import modify_file_content
-from swarms_tools.search.msg_notify_user import notify_user
+"""Lazy-loading package init for swarms_tools.search.
+
+Submodules pull in heavy optional dependencies (httpx TLS setup,
+beautifulsoup, LLM clients, ...), so nothing is imported until the
+attribute is first accessed (PEP 562). ``from swarms_tools.search
+import exa_search`` no longer pays the import cost of every sibling
+module.
+"""
+
+import importlib
+from typing import Tuple
+
+# Public attribute -> (module path, attribute name)
+_LAZY = {
+    "exa_search": (
+        "swarms_tools.search.exa_search",
+        "exa_search",
+    ),
+    "scrape_and_format_sync": (
+        "swarms_tools.search.web_scraper",
+        "scrape_and_format_sync",
+    ),
+    "scrape_multiple_urls_sync": (
+        "swarms_tools.search.web_scraper",
+        "scrape_multiple_urls_sync",
+    ),
+    "crawl_entire_site_firecrawl": (
+        "swarms_tools.search.firecrawl",
+        "crawl_entire_site_firecrawl",
+    ),
+    "modify_file_content": (
+        "swarms_tools.search.self_evolve",
+        "modify_file_content",
+    ),
+    "modify_file_content_many": (
+        "swarms_tools.search.self_evolve",
+        "modify_file_content_many",
+    ),
+    "notify_user": (
+        "swarms_tools.search.msg_notify_user",
+        "notify_user",
+    ),
+    "task_planner": (
+        "swarms_tools.search.task_mgm",
+        "task_planner",
+    ),
+    "generate_todo_md": (
+        "swarms_tools.search.task_mgm",
+        "generate_todo_md",
+    ),
+    "update_task_completion": (
+        "swarms_tools.search.task_mgm",
+        "update_task_completion",
+    ),
+    "run_task_with_timeout": (
+        "swarms_tools.search.run_task",
+        "run_task_with_timeout",
+    ),
+    "run_task_without_timeout": (
+        "swarms_tools.search.run_task",
+        "run_task_without_timeout",
+    ),
+    "arun_task": (
+        "swarms_tools.search.run_task",
+        "arun_task",
+    ),
+    "run_tasks_without_timeout": (
+        "swarms_tools.search.run_task",
+        "run_tasks_without_timeout",
+    ),
+    "end_task": (
+        "swarms_tools.search.end_task",
+        "end_task",
+    ),
+    "advance_phase": (
+        "swarms_tools.search.advance_phase",
+        "advance_phase",
+    ),
+    "run_phase_tasks_from_todo": (
+        "swarms_tools.search.advance_phase",
+        "run_phase_tasks_from_todo",
+    ),
+    "load_task_plan_from_todo": (
+        "swarms_tools.search.advance_phase",
+        "load_task_plan_from_todo",
+    ),
+    "scroll_and_record": (
+        "swarms_tools.search.scroll_recorder",
+        "scroll_and_record",
+    ),
+    "generate_detailed_plan": (
+        "swarms_tools.search.planner",
+        "generate_detailed_plan",
+    ),
+    "update_plan_with_input": (
+        "swarms_tools.search.planner",
+        "update_plan_with_input",
+    ),
+    "agenerate_detailed_plan": (
+        "swarms_tools.search.planner",
+        "agenerate_detailed_plan",
+    ),
+    "aupdate_plan_with_input": (
+        "swarms_tools.search.planner",
+        "aupdate_plan_with_input",
+    ),
+    "generate_many_plans": (
+        "swarms_tools.search.planner",
+        "generate_many_plans",
+    ),
+    "generate_plans_batch": (
+        "swarms_tools.search.planner",
+        "generate_plans_batch",
+    ),
+}
+
+# Names whose modules sit behind optional heavy dependencies
+# (opencv/selenium for the recorder, openai/numpy for the
+# planner). They are excluded from ``__all__`` because the
+# top-level package does ``from swarms_tools.search import *``,
+# and resolving them there would eagerly import those
+# dependencies on every ``import swarms_tools``. They stay
+# reachable lazily as attributes of this module.
+_OPTIONAL_ONLY = {
+    "scroll_and_record",
+    "generate_detailed_plan",
+    "update_plan_with_input",
+    "agenerate_detailed_plan",
+    "aupdate_plan_with_input",
+    "generate_many_plans",
+    "generate_plans_batch",
+}
 
 __all__ = [
-    "exa_search",
-    "scrape_and_format_sync",
-    "scrape_multiple_urls_sync",
-    "crawl_entire_site_firecrawl",
-    "modify_file_content",
-    "notify_user",
+    name for name in _LAZY if name not in _OPTIONAL_ONLY
 ]
+
+
+def __getattr__(name: str):
+    try:
+        module_path, attr_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+    value = getattr(
+        importlib.import_module(module_path), attr_name
+    )
+    # Cache so subsequent lookups skip __getattr__ entirely.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> Tuple[str, ...]:
+    return tuple(sorted(set(globals()) | set(_LAZY)))
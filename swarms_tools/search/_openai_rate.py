@@ -0,0 +1,159 @@
+"""Token-bucket rate gate for OpenAI API calls.
+
+Uncontrolled fan-out (``generate_many_plans``, agent batches)
+trips the account's RPM/TPM limits and collapses throughput into
+429-retry storms. This module meters every call through two
+token buckets — requests per minute and tokens per minute — plus
+a bounded concurrency semaphore, following the OpenAI cookbook's
+parallel-processor pattern. Buckets refill continuously from the
+monotonic clock on each acquire rather than via a background
+task, so the gate works across the short-lived event loops the
+sync wrappers create.
+"""
+
+import asyncio
+import functools
+import os
+import threading
+import time
+import weakref
+from typing import Any, Awaitable, Callable
+
+_DEFAULT_RPM = 3000
+_DEFAULT_TPM = 250_000
+_DEFAULT_CONCURRENCY = 32
+
+
+class RateLimiter:
+    """RPM/TPM token buckets shared across threads and loops.
+
+    Args:
+        max_requests_per_minute: Sustained request budget.
+        max_tokens_per_minute: Sustained token budget.
+        max_concurrency: In-flight request cap per event loop.
+    """
+
+    def __init__(
+        self,
+        max_requests_per_minute: float = _DEFAULT_RPM,
+        max_tokens_per_minute: float = _DEFAULT_TPM,
+        max_concurrency: int = _DEFAULT_CONCURRENCY,
+    ):
+        self.max_requests_per_minute = max_requests_per_minute
+        self.max_tokens_per_minute = max_tokens_per_minute
+        self.max_concurrency = max_concurrency
+        self._lock = threading.Lock()
+        self._request_budget = float(max_requests_per_minute)
+        self._token_budget = float(max_tokens_per_minute)
+        self._last_refill = time.monotonic()
+        # asyncio primitives bind to one loop; keep one semaphore
+        # per loop so the limiter survives repeated asyncio.run.
+        self._semaphores: (
+            "weakref.WeakKeyDictionary[Any, asyncio.Semaphore]"
+        ) = weakref.WeakKeyDictionary()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self._request_budget = min(
+            self.max_requests_per_minute,
+            self._request_budget
+            + elapsed * self.max_requests_per_minute / 60.0,
+        )
+        self._token_budget = min(
+            self.max_tokens_per_minute,
+            self._token_budget
+            + elapsed * self.max_tokens_per_minute / 60.0,
+        )
+
+    def _try_acquire(self, est_tokens: float) -> float:
+        """Deduct capacity, or return seconds until enough
+        accrues."""
+        with self._lock:
+            self._refill()
+            if (
+                self._request_budget >= 1.0
+                and self._token_budget >= est_tokens
+            ):
+                self._request_budget -= 1.0
+                self._token_budget -= est_tokens
+                return 0.0
+            request_wait = (
+                (1.0 - self._request_budget)
+                * 60.0
+                / self.max_requests_per_minute
+            )
+            token_wait = (
+                (est_tokens - self._token_budget)
+                * 60.0
+                / self.max_tokens_per_minute
+            )
+            return max(request_wait, token_wait, 0.05)
+
+    def _loop_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(
+                self.max_concurrency
+            )
+            self._semaphores[loop] = semaphore
+        return semaphore
+
+    async def acquire(self, est_tokens: float) -> None:
+        """Wait until both buckets can cover the request."""
+        while True:
+            wait = self._try_acquire(est_tokens)
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
+
+    async def submit(
+        self,
+        request_fn: Callable[[], Awaitable[Any]],
+        est_tokens: float = 1000,
+    ) -> Any:
+        """Run ``request_fn`` once capacity allows.
+
+        Args:
+            request_fn: Zero-arg callable returning the API
+                awaitable.
+            est_tokens: Estimated prompt+completion tokens the
+                call will consume.
+
+        Returns:
+            Whatever ``request_fn`` resolves to.
+        """
+        async with self._loop_semaphore():
+            await self.acquire(est_tokens)
+            return await request_fn()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_limiter() -> RateLimiter:
+    return RateLimiter(
+        max_requests_per_minute=float(
+            os.getenv(
+                "OPENAI_MAX_REQUESTS_PER_MINUTE", _DEFAULT_RPM
+            )
+        ),
+        max_tokens_per_minute=float(
+            os.getenv(
+                "OPENAI_MAX_TOKENS_PER_MINUTE", _DEFAULT_TPM
+            )
+        ),
+        max_concurrency=int(
+            os.getenv(
+                "OPENAI_MAX_CONCURRENCY", _DEFAULT_CONCURRENCY
+            )
+        ),
+    )
+
+
+async def submit(
+    request_fn: Callable[[], Awaitable[Any]],
+    est_tokens: float = 1000,
+) -> Any:
+    """Meter an OpenAI call through the process-wide limiter."""
+    return await _get_limiter().submit(request_fn, est_tokens)
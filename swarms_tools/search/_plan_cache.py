@@ -0,0 +1,156 @@
+"""Similarity-keyed cache of generated plans.
+
+Backs the planner's plan-template reuse: every generated plan is
+stored in SQLite together with an embedding of its task text, and
+lookups score a new task against all cached embeddings in one
+vectorized cosine pass (``emb @ matrix.T`` over L2-normalized
+rows). The planner then reuses an existing plan outright for
+near-identical tasks, or adapts one with a cheaper model for
+merely similar ones, instead of regenerating from scratch.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import orjson
+
+_DB_PATH = os.path.expanduser(
+    "~/.cache/swarms_tools/plan_cache.db"
+)
+_MAX_ENTRIES = 512
+_TTL_SECONDS = 7 * 24 * 3600
+
+
+class PlanCache:
+    """SQLite-backed plan store with in-memory cosine lookup.
+
+    Rows persist across processes; the embedding matrix is loaded
+    once per instance and kept normalized so a lookup is a single
+    matrix-vector product rather than a per-row loop.
+    """
+
+    def __init__(
+        self,
+        db_path: str = _DB_PATH,
+        max_entries: int = _MAX_ENTRIES,
+        ttl_seconds: float = _TTL_SECONDS,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self._conn = sqlite3.connect(
+            db_path, check_same_thread=False
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS plans ("
+            "task_hash TEXT PRIMARY KEY,"
+            "task TEXT,"
+            "embedding BLOB,"
+            "plan_json BLOB,"
+            "created_at REAL)"
+        )
+        self._evict()
+        self._load()
+
+    def _evict(self) -> None:
+        """Drop expired rows and trim to ``max_entries`` (oldest
+        first)."""
+        cutoff = time.time() - self.ttl_seconds
+        self._conn.execute(
+            "DELETE FROM plans WHERE created_at < ?", (cutoff,)
+        )
+        self._conn.execute(
+            "DELETE FROM plans WHERE task_hash NOT IN ("
+            "SELECT task_hash FROM plans"
+            " ORDER BY created_at DESC LIMIT ?)",
+            (self.max_entries,),
+        )
+        self._conn.commit()
+
+    def _load(self) -> None:
+        rows = self._conn.execute(
+            "SELECT task_hash, task, embedding, plan_json"
+            " FROM plans ORDER BY created_at"
+        ).fetchall()
+        self._hashes: List[str] = [row[0] for row in rows]
+        self._tasks: List[str] = [row[1] for row in rows]
+        self._plans: List[List[Dict[str, Any]]] = [
+            orjson.loads(row[3]) for row in rows
+        ]
+        if rows:
+            matrix = np.stack(
+                [
+                    np.frombuffer(row[2], dtype=np.float32)
+                    for row in rows
+                ]
+            )
+            self._matrix: Optional[np.ndarray] = (
+                matrix
+                / np.linalg.norm(
+                    matrix, axis=1, keepdims=True
+                )
+            )
+        else:
+            self._matrix = None
+
+    def lookup(
+        self, embedding: np.ndarray
+    ) -> Optional[Tuple[float, str, List[Dict[str, Any]]]]:
+        """Return ``(similarity, task, plan)`` for the nearest
+        cached task, or None when the cache is empty."""
+        with self._lock:
+            if self._matrix is None:
+                return None
+            query = embedding.astype(np.float32)
+            query = query / np.linalg.norm(query)
+            sims = self._matrix @ query
+            best = int(np.argmax(sims))
+            return (
+                float(sims[best]),
+                self._tasks[best],
+                self._plans[best],
+            )
+
+    def insert(
+        self,
+        task: str,
+        embedding: np.ndarray,
+        plan: List[Dict[str, Any]],
+    ) -> None:
+        """Store (or refresh) the plan cached for ``task``."""
+        task_hash = hashlib.blake2b(
+            task.encode(), digest_size=16
+        ).hexdigest()
+        vector = embedding.astype(np.float32)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO plans VALUES"
+                " (?, ?, ?, ?, ?)",
+                (
+                    task_hash,
+                    task,
+                    vector.tobytes(),
+                    orjson.dumps(plan),
+                    time.time(),
+                ),
+            )
+            self._evict()
+            if task_hash in self._hashes:
+                self._load()
+                return
+            normalized = vector / np.linalg.norm(vector)
+            self._hashes.append(task_hash)
+            self._tasks.append(task)
+            self._plans.append(plan)
+            if self._matrix is None:
+                self._matrix = normalized[np.newaxis, :]
+            else:
+                self._matrix = np.vstack(
+                    [self._matrix, normalized]
+                )
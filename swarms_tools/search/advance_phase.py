@@ -0,0 +1,249 @@
+"""Drive a todo.md task plan phase by phase.
+
+Parses ``todo.md`` back into the :mod:`task_mgm` models, exposes
+phase lookup helpers, and runs every open task in a phase through
+its assigned agent.
+"""
+
+import functools
+import itertools
+import os
+import re
+from concurrent.futures import (
+    ThreadPoolExecutor,
+    as_completed,
+)
+from typing import Any, Dict, List, Optional, Tuple
+
+from swarms_tools.search.end_task import EndTaskBatch
+from swarms_tools.search.run_task import run_task_without_timeout
+from swarms_tools.search.task_mgm import Phase, Task, TaskPlan
+
+# Hoisted to module scope so hot parse loops reuse the compiled
+# patterns instead of re-resolving them per line.
+_AGENT_RE = re.compile(r"##AGENT:([A-Za-z0-9_]+)##")
+_PCT_RE = re.compile(
+    r"\*\*Overall Completion: ([\d\.]+)%\*\*"
+)
+
+# Ids synthesized during parsing only need to be unique within the
+# process; a counter avoids one urandom read per uuid4() call.
+_seq = itertools.count()
+
+
+def extract_agent_from_description(
+    description: str,
+) -> Optional[str]:
+    """Pull the ``##AGENT:name##`` marker out of a task line."""
+    match = _AGENT_RE.search(description)
+    return match.group(1) if match else None
+
+
+def load_task_plan_from_todo(todo_md_path: str) -> TaskPlan:
+    """Parse a ``todo.md`` file back into a :class:`TaskPlan`.
+
+    Parses are memoized by ``(path, mtime_ns, size)``, so repeated
+    loads of an unchanged file skip the file read entirely; any
+    rewrite (e.g. by ``end_task``) changes the stat key and
+    invalidates the entry naturally.
+
+    Args:
+        todo_md_path: Path of the todo file to parse.
+
+    Returns:
+        The reconstructed plan. Task and phase ids are synthesized
+        because the file does not store them. Callers get a deep
+        copy, so mutating the returned plan never corrupts the
+        cache.
+    """
+    stat = os.stat(todo_md_path)
+    cached = _load_task_plan_cached(
+        todo_md_path, stat.st_mtime_ns, stat.st_size
+    )
+    return cached.model_copy(deep=True)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_task_plan_cached(
+    todo_md_path: str, mtime_ns: int, size: int
+) -> TaskPlan:
+    phases: List[Phase] = []
+    current_phase: Optional[Phase] = None
+    overall_completion = 0.0
+
+    # Single streaming pass: no line-list materialization and no
+    # second scan for the completion percentage.
+    with open(todo_md_path, "r") as f:
+        first_line = next(f, "").rstrip("\n")
+        if first_line.startswith("# "):
+            project_name = first_line[2:].strip()
+        else:
+            project_name = "Untitled Project"
+
+        for line_idx, line in enumerate(f, start=2):
+            line = line.rstrip("\n")
+            if line.startswith("## "):
+                current_phase = Phase(
+                    id=f"parsed-{next(_seq):08x}",
+                    phase_name=line[3:].strip(),
+                    tasks=[],
+                    is_active=not phases,
+                )
+                phases.append(current_phase)
+            elif line.startswith("[ ]") or line.startswith(
+                "[X]"
+            ):
+                completed = line.startswith("[X]")
+                body = line[3:].strip()
+                agent = extract_agent_from_description(body)
+                description = _AGENT_RE.sub("", body).strip()
+                if current_phase is None:
+                    current_phase = Phase(
+                        id=f"parsed-{next(_seq):08x}",
+                        phase_name="Phase 1",
+                        tasks=[],
+                        is_active=True,
+                    )
+                    phases.append(current_phase)
+                current_phase.tasks.append(
+                    Task(
+                        id=f"parsed-{next(_seq):08x}",
+                        description=description,
+                        agent=agent,
+                        completed=completed,
+                        line_number=line_idx,
+                    )
+                )
+            elif line.startswith("**Overall Completion:"):
+                # Footer reached: grab the percentage and stop
+                # consuming the buffered reader so trailing
+                # boilerplate is never read.
+                match = _PCT_RE.match(line)
+                if match:
+                    overall_completion = float(match.group(1))
+                break
+
+    return TaskPlan(
+        project_name=project_name,
+        phases=phases,
+        overall_completion=overall_completion,
+        phases_by_name={
+            phase.phase_name: phase for phase in phases
+        },
+    )
+
+
+def get_task_and_agent_by_phase(
+    phase_name: str,
+    task_description: str,
+    todo_md_path: str,
+) -> Tuple[Optional[Task], Optional[str]]:
+    """Find a task (and its agent) by phase and description."""
+    task_plan = load_task_plan_from_todo(todo_md_path)
+    phase = task_plan.phases_by_name.get(phase_name)
+    if phase is None:
+        return None, None
+    for task in phase.tasks:
+        if task.description == task_description:
+            return task, task.agent
+    return None, None
+
+
+def run_phase_tasks_from_todo(
+    phase_name: str,
+    agents: Dict[str, Any],
+    todo_md_path: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """Run every open task in a phase through its assigned agent.
+
+    Args:
+        phase_name: Name of the phase (``## ...`` header) to run.
+        agents: Mapping of agent name to callable agent.
+        todo_md_path: Path to todo.md; defaults to
+            ``<cwd>/todo.md``.
+
+    Returns:
+        One :func:`run_task_without_timeout` result dict per task
+        executed.
+    """
+    if todo_md_path is None:
+        todo_md_path = os.path.join(os.getcwd(), "todo.md")
+
+    task_plan = load_task_plan_from_todo(todo_md_path)
+    phase = task_plan.phases_by_name.get(phase_name)
+    if phase is None:
+        print(f"Phase '{phase_name}' not found in todo.md")
+        return []
+
+    runnable: List[Task] = []
+    for task in phase.tasks:
+        if task.completed:
+            continue
+        if not task.agent or agents.get(task.agent) is None:
+            print(
+                f"No agent available for task: "
+                f"{task.description}"
+            )
+            continue
+        runnable.append(task)
+    if not runnable:
+        return []
+
+    # Tasks within a phase carry no declared inter-task
+    # dependencies, and agent calls are network/LLM bound, so run
+    # them concurrently; completions are still marked through the
+    # batch on the main thread and flushed in one write.
+    results: List[Dict[str, Any]] = []
+    with EndTaskBatch(todo_md_path) as batch:
+        with ThreadPoolExecutor(
+            max_workers=min(8, len(runnable))
+        ) as executor:
+            future_map = {
+                executor.submit(
+                    run_task_without_timeout,
+                    agent=agents[task.agent],
+                    task_description=task.description,
+                    args=task.args,
+                    kwargs=task.kwargs,
+                ): task
+                for task in runnable
+            }
+            for future in as_completed(future_map):
+                task = future_map[future]
+                result = future.result()
+                results.append(result)
+                # Only successful runs check the box; a failed
+                # task stays open in todo.md for a retry.
+                if (
+                    result["status"] == "success"
+                    and task.line_number is not None
+                ):
+                    batch.mark(task.line_number)
+    return results
+
+
+def advance_phase(
+    todo_md_path: Optional[str] = None,
+) -> Optional[str]:
+    """Return the name of the next phase with open tasks.
+
+    Args:
+        todo_md_path: Path to todo.md; defaults to
+            ``<cwd>/todo.md``.
+
+    Returns:
+        The phase name to work on next, or None when every phase
+        is complete.
+    """
+    if todo_md_path is None:
+        todo_md_path = os.path.join(os.getcwd(), "todo.md")
+    task_plan = load_task_plan_from_todo(todo_md_path)
+    for phase in task_plan.phases:
+        if any(not task.completed for task in phase.tasks):
+            print(f"Advancing to phase: {phase.phase_name}")
+            return phase.phase_name
+    print(
+        f"All phases complete "
+        f"({task_plan.overall_completion:.1f}%)"
+    )
+    return None
@@ -0,0 +1,145 @@
+"""Mark todo.md tasks complete and refresh the completion footer."""
+
+import os
+import re
+from typing import List, Optional, Set
+
+# Compiled once at import: these patterns run against every line of
+# todo.md on each update, and re's internal cache re-hashes the
+# literal pattern string on every call.
+_CHECKBOX_EMPTY = re.compile(r"^\[\s\]")
+_PCT_LINE = re.compile(r"^\*\*Overall Completion: [\d\.]+%\*\*")
+
+
+class EndTaskBatch:
+    """Batch several task completions into one todo.md rewrite.
+
+    Reads the file once on entry, accumulates line numbers via
+    :meth:`mark`, and writes the file (plus the refreshed
+    completion footer) exactly once on exit. Marking K tasks costs
+    one read and one write instead of K of each.
+
+    Example:
+        >>> with EndTaskBatch("todo.md") as batch:
+        ...     batch.mark(3)
+        ...     batch.mark(4)
+    """
+
+    def __init__(self, todo_md_path: Optional[str] = None):
+        if todo_md_path is None:
+            todo_md_path = os.path.join(os.getcwd(), "todo.md")
+        self.todo_md_path = todo_md_path
+        self.completion = 0.0
+        self._marks: Set[int] = set()
+        self._text: Optional[str] = None
+        self._lines: Optional[List[str]] = None
+        self._dirty = False
+
+    def __enter__(self) -> "EndTaskBatch":
+        # One buffered read + decode; lines are only split out (in
+        # a single C-level splitlines call) when a mutation is
+        # actually queued.
+        with open(self.todo_md_path, "rb") as f:
+            self._text = f.read().decode("utf-8")
+        self._lines = None
+        return self
+
+    def mark(self, line_number: int) -> bool:
+        """Queue ``line_number`` (1-based) to be marked complete.
+
+        Returns:
+            True when the line exists, False otherwise.
+        """
+        if self._lines is None and self._text is not None:
+            self._lines = self._text.splitlines(keepends=True)
+        idx = line_number - 1
+        if (
+            self._lines is None
+            or idx < 0
+            or idx >= len(self._lines)
+        ):
+            print(
+                f"Line {line_number} is outside "
+                f"{self.todo_md_path}."
+            )
+            return False
+        self._marks.add(idx)
+        self._dirty = True
+        return True
+
+    def flush(self) -> float:
+        """Apply queued marks and rewrite the file once.
+
+        Returns:
+            The recomputed overall completion percentage.
+        """
+        if self._lines is None or not self._dirty:
+            return self.completion
+        lines = self._lines
+        for idx in self._marks:
+            lines[idx] = _CHECKBOX_EMPTY.sub(
+                "[X]", lines[idx], count=1
+            )
+        self._marks.clear()
+
+        # str.count is a single C-level scan over the buffer vs
+        # two regex-engine invocations per line.
+        buf = "".join(lines)
+        num_completed = buf.count("[X]")
+        num_open = buf.count("[ ]")
+        num_total = num_completed + num_open
+        self.completion = (
+            num_completed / num_total * 100
+            if num_total
+            else 0.0
+        )
+
+        for i, line in enumerate(lines):
+            if _PCT_LINE.match(line):
+                lines[i] = (
+                    f"**Overall Completion: "
+                    f"{self.completion:.1f}%**\n"
+                )
+                break
+
+        self._text = "".join(lines)
+        with open(self.todo_md_path, "w") as f:
+            f.write(self._text)
+        self._dirty = False
+        return self.completion
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.flush()
+
+
+def end_task(
+    line_number: int,
+    todo_md_path: Optional[str] = None,
+) -> str:
+    """Mark the checkbox on ``line_number`` (1-based) as done.
+
+    One-shot wrapper around :class:`EndTaskBatch`; callers marking
+    many tasks should use the batch directly to avoid one full
+    read+write per task.
+
+    Args:
+        line_number: 1-based line of the task in todo.md.
+        todo_md_path: Path to the todo file; defaults to
+            ``<cwd>/todo.md``.
+
+    Returns:
+        A human-readable status message.
+    """
+    with EndTaskBatch(todo_md_path) as batch:
+        if not batch.mark(line_number):
+            return (
+                f"Line {line_number} is outside "
+                f"{batch.todo_md_path}."
+            )
+    message = (
+        f"Marked line {line_number} complete "
+        f"({batch.completion:.1f}% overall)."
+    )
+    print(message)
+    return message
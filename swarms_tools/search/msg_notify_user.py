@@ -1,5 +1,18 @@
+import re
 import sys
 
+# Single compiled alternation per trigger class: one C-level scan
+# over the query instead of one Python-level substring search per
+# trigger word.
+_INPUT_RE = re.compile(
+    r"\b(?:input|need|require|waiting|please provide"
+    r"|user action|enter|your response|respond|type|confirm)\b"
+)
+_STATUS_RE = re.compile(
+    r"\b(?:status|progress|update|complete|done"
+    r"|finished|processing)\b"
+)
+
 def notify_user(query: str) -> str:
     """
     User notification and input handler for agent requests and status.
@@ -10,15 +23,8 @@ def notify_user(query: str) -> str:
 
     query_lower = query.lower().strip()
 
-    input_triggers = [
-        "input", "need", "require", "waiting", "please provide", "user action", "enter", "your response", "respond", "type", "confirm"
-    ]
-    status_triggers = [
-        "status", "progress", "update", "complete", "done", "finished", "processing"
-    ]
-
     if (
-        any(word in query_lower for word in input_triggers)
+        _INPUT_RE.search(query_lower)
         or query_lower.endswith("?")
         or query_lower.startswith("please")
         or query_lower.startswith("enter")
@@ -31,7 +37,7 @@ def notify_user(query: str) -> str:
             print("[ERROR] No input received (EOF). Returning empty string.")
             return ""
         return user_response
-    elif any(word in query_lower for word in status_triggers):
+    elif _STATUS_RE.search(query_lower):
         print(f"\n[AGENT STATUS] {query}")
         sys.stdout.flush()
         return None
@@ -39,4 +45,4 @@ def notify_user(query: str) -> str:
     else:
         print(f"\n[AGENT MESSAGE] {query}")
         sys.stdout.flush()
-        return None
\ No newline at end of file
+        return None
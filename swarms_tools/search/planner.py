@@ -0,0 +1,668 @@
+"""LLM-backed planning tools for multi-agent task execution.
+
+Generates and updates phase/task plans (consumable by
+``task_mgm.task_planner``) via OpenAI chat completions. Model
+responses are cached on disk keyed by a hash of the full prompt, so
+identical planning requests never pay the network and token cost
+twice. The implementations are async (``agenerate_detailed_plan``
+etc.) so callers can fan plans out concurrently —
+``generate_many_plans`` gathers a whole batch, making wall time
+track the slowest single call instead of the sum — while the sync
+entry points remain as thin ``asyncio.run`` wrappers.
+"""
+
+import asyncio
+import atexit
+import functools
+import hashlib
+import os
+from typing import Any, Dict, List, Optional
+
+import httpx
+import numpy as np
+from dotenv import load_dotenv
+from openai import AsyncOpenAI
+
+from swarms_tools.search import _openai_rate
+from swarms_tools.search._plan_cache import PlanCache
+
+# orjson parses/serializes several times faster than stdlib json
+# on plan-sized payloads; fall back to stdlib so the planner still
+# works in environments without the C extension.
+try:
+    import orjson
+
+    def _json_dumps_indented(obj: Any) -> str:
+        return orjson.dumps(
+            obj, option=orjson.OPT_INDENT_2
+        ).decode()
+
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover
+    import json
+
+    def _json_dumps_indented(obj: Any) -> str:
+        return json.dumps(obj, indent=2)
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+    _json_loads = json.loads
+
+_CACHE_DIR = os.path.expanduser("~/.cache/swarms_tools/planner")
+
+# Plan-template reuse: tasks at least _REUSE_THRESHOLD similar to
+# a cached task get that plan verbatim; tasks above
+# _ADAPT_THRESHOLD get the cached plan adapted by a cheap model
+# instead of a from-scratch generation with the big one.
+_EMBED_MODEL = "text-embedding-3-small"
+_ADAPT_MODEL = "gpt-4o-mini"
+_REUSE_THRESHOLD = 0.90
+_ADAPT_THRESHOLD = 0.75
+
+# One stable instruction block shared verbatim by both planner
+# entry points, sent as the system message. Keeping it identical
+# and byte-stable (no dynamic tokens before it) lets provider-side
+# prompt caching hit the prefix on every call; only the short user
+# message varies.
+_PLAN_SYSTEM_PROMPT = (
+    "You are an expert project planner for a team of AI"
+    " agents.\n"
+    "When given a task, break it into sequential phases, each"
+    " with concrete tasks, and assign every task to one of the"
+    " available agents.\n"
+    "When given an existing plan plus update input, update the"
+    " plan based on that input, keeping the same structure and"
+    " reassigning agents only where necessary.\n"
+    'Respond with a JSON object {"steps": [...]} where each'
+    " step is a phase dict.\n"
+    "When asked for patch operations instead, respond with"
+    ' {"ops": [...]} where each op is {"op":'
+    ' "replace"|"add"|"remove", "id": <step id or null>,'
+    ' "step": <phase dict or null>}, patching the referenced'
+    " steps of the existing plan."
+)
+
+# The plan shape is declared to the model as a strict JSON
+# schema, so responses always carry the phase list under "steps"
+# and no heuristic unwrapping of the reply is needed.
+_PLAN_STEP_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "phase_name": {"type": "string"},
+        "tasks": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "description": {"type": "string"},
+                    "agent": {
+                        "type": ["string", "null"]
+                    },
+                },
+                "required": ["description", "agent"],
+                "additionalProperties": False,
+            },
+        },
+    },
+    "required": ["phase_name", "tasks"],
+    "additionalProperties": False,
+}
+_PLAN_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "plan",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "steps": {
+                    "type": "array",
+                    "items": _PLAN_STEP_SCHEMA,
+                }
+            },
+            "required": ["steps"],
+            "additionalProperties": False,
+        },
+    },
+}
+_PLAN_OPS_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "plan_ops",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "ops": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "op": {
+                                "type": "string",
+                                "enum": [
+                                    "replace",
+                                    "add",
+                                    "remove",
+                                ],
+                            },
+                            "id": {
+                                "type": ["string", "null"]
+                            },
+                            "step": {
+                                "anyOf": [
+                                    _PLAN_STEP_SCHEMA,
+                                    {"type": "null"},
+                                ]
+                            },
+                        },
+                        "required": ["op", "id", "step"],
+                        "additionalProperties": False,
+                    },
+                }
+            },
+            "required": ["ops"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+# In-process memo for completed chats; lru_cache cannot wrap a
+# coroutine (it would cache the one-shot coroutine object), so the
+# async path keeps a plain dict keyed like the disk cache.
+_mem_cache: Dict[str, str] = {}
+
+
+@functools.lru_cache(maxsize=1)
+def _get_http_client() -> httpx.AsyncClient:
+    """One process-wide HTTP/2 connection pool, built lazily.
+
+    Keepalive skips the TCP+TLS handshake (~50-200ms) on every
+    call after the first, and HTTP/2 multiplexes the concurrent
+    requests issued by generate_many_plans over one connection.
+    """
+    http_client = httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(
+            max_connections=64,
+            max_keepalive_connections=32,
+            keepalive_expiry=60,
+        ),
+        timeout=httpx.Timeout(60, connect=10),
+    )
+    atexit.register(
+        lambda: asyncio.run(http_client.aclose())
+    )
+    return http_client
+
+
+@functools.lru_cache(maxsize=1)
+def _get_async_client() -> AsyncOpenAI:
+    """Build the OpenAI client on first LLM call, not at import.
+
+    Importers that only touch the non-LLM helpers never pay for
+    env loading or connection-pool setup, and forked workers get
+    a fresh client after :func:`reset_clients`.
+    """
+    load_dotenv()
+    return AsyncOpenAI(
+        api_key=os.getenv("OPENAI_API_KEY"),
+        http_client=_get_http_client(),
+    )
+
+
+def reset_clients() -> None:
+    """Drop the cached clients (test isolation / after fork).
+
+    Inherited sockets are unusable in a forked worker; call this
+    post-fork so the next LLM call rebuilds both clients.
+    """
+    _get_async_client.cache_clear()
+    _get_http_client.cache_clear()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_plan_cache() -> PlanCache:
+    """Open the similarity cache on first use, not at import."""
+    return PlanCache()
+
+
+async def _embed_task(task_input: str) -> np.ndarray:
+    client = _get_async_client()
+    response = await _openai_rate.submit(
+        lambda: client.embeddings.create(
+            model=_EMBED_MODEL, input=task_input
+        ),
+        est_tokens=len(task_input) // 4 + 1,
+    )
+    return np.asarray(
+        response.data[0].embedding, dtype=np.float32
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _render_agents(agents: tuple) -> str:
+    """Render the available-agents block, cached per agent tuple."""
+    return "\n".join(f"- {agent}" for agent in agents)
+
+
+def _step_id(step: Dict[str, Any]) -> str:
+    """Stable content hash of a step, ignoring the id itself."""
+    core = {
+        key: value
+        for key, value in step.items()
+        if key != "_id"
+    }
+    return hashlib.blake2b(
+        _json_dumps(core), digest_size=8
+    ).hexdigest()
+
+
+def _tag_steps(
+    plan: List[Dict[str, Any]],
+) -> List[Dict[str, Any]]:
+    """Ensure every step carries a stable ``_id``."""
+    for step in plan:
+        step["_id"] = _step_id(step)
+    return plan
+
+
+def _apply_plan_ops(
+    plan: List[Dict[str, Any]],
+    ops: List[Dict[str, Any]],
+) -> List[Dict[str, Any]]:
+    """Apply replace/add/remove patch ops to a tagged plan.
+
+    Raises KeyError for ops referencing unknown step ids, which
+    callers treat as a signal to fall back to full-plan mode.
+    """
+    index_by_id = {
+        step["_id"]: idx for idx, step in enumerate(plan)
+    }
+    updated: List[Optional[Dict[str, Any]]] = list(plan)
+    for op in ops:
+        kind = op["op"]
+        if kind == "replace":
+            updated[index_by_id[op["id"]]] = op["step"]
+        elif kind == "add":
+            updated.append(op["step"])
+        elif kind == "remove":
+            updated[index_by_id[op["id"]]] = None
+    return [step for step in updated if step is not None]
+
+
+async def _cached_chat(
+    user_prompt: str,
+    model: str,
+    response_format: Dict = _PLAN_RESPONSE_FORMAT,
+) -> str:
+    """Chat completion cached in memory and on disk.
+
+    The cache key is a blake2b hash of ``model`` plus the shared
+    system prompt and the user prompt; hits skip the API
+    entirely. Disk entries are written atomically (tmp file +
+    os.replace) so concurrent processes never observe a torn
+    cache file.
+
+    Args:
+        user_prompt: Dynamic user message to send after the
+            shared system prompt.
+        model: Model name to call.
+
+    Returns:
+        The raw message content returned by the model.
+    """
+    format_name = response_format["json_schema"]["name"]
+    key = hashlib.blake2b(
+        f"{model}\0{format_name}\0{_PLAN_SYSTEM_PROMPT}"
+        f"\0{user_prompt}".encode(),
+        digest_size=16,
+    ).hexdigest()
+    if key in _mem_cache:
+        return _mem_cache[key]
+    cache_path = os.path.join(_CACHE_DIR, f"{key}.json")
+    if os.path.exists(cache_path):
+        with open(cache_path, "rb") as f:
+            content = _json_loads(f.read())["content"]
+        _mem_cache[key] = content
+        return content
+
+    # Rough token estimate (~4 chars/token) plus completion
+    # headroom, for the TPM bucket.
+    est_tokens = (
+        len(_PLAN_SYSTEM_PROMPT) + len(user_prompt)
+    ) // 4 + 1500
+    client = _get_async_client()
+    response = await _openai_rate.submit(
+        lambda: client.chat.completions.create(
+            model=model,
+            messages=[
+                {
+                    "role": "system",
+                    "content": _PLAN_SYSTEM_PROMPT,
+                },
+                {"role": "user", "content": user_prompt},
+            ],
+            response_format=response_format,
+        ),
+        est_tokens=est_tokens,
+    )
+    content = response.choices[0].message.content
+
+    os.makedirs(_CACHE_DIR, exist_ok=True)
+    tmp_path = f"{cache_path}.tmp.{os.getpid()}"
+    with open(tmp_path, "wb") as f:
+        f.write(_json_dumps({"content": content}))
+    os.replace(tmp_path, cache_path)
+    _mem_cache[key] = content
+    return content
+
+
+async def agenerate_detailed_plan(
+    task_input: str,
+    available_agents: List[str],
+    model: str = "gpt-4o-mini",
+) -> List[Dict[str, Any]]:
+    """Generate a phased task plan for ``task_input``.
+
+    Args:
+        task_input: Natural-language description of the project.
+        available_agents: Agent names tasks may be assigned to.
+        model: Chat model to use.
+
+    Returns:
+        A list of phase dicts shaped like
+        ``{"phase_name": ..., "tasks": [{"description": ...,
+        "agent": ...}]}`` suitable for ``task_planner``.
+    """
+    # An embedding call costs a fraction of a plan generation, so
+    # check for a reusable cached plan before prompting the big
+    # model at all.
+    plan_cache = _get_plan_cache()
+    embedding = await _embed_task(task_input)
+    nearest = plan_cache.lookup(embedding)
+    if nearest is not None:
+        similarity, _, cached_plan = nearest
+        if similarity >= _REUSE_THRESHOLD:
+            return cached_plan
+        if similarity >= _ADAPT_THRESHOLD:
+            plan = await aupdate_plan_with_input(
+                cached_plan,
+                task_input,
+                available_agents,
+                model=_ADAPT_MODEL,
+            )
+            plan_cache.insert(task_input, embedding, plan)
+            return plan
+
+    agents_str = _render_agents(tuple(available_agents))
+    user_prompt = (
+        f"Available agents:\n{agents_str}\n\n"
+        f"Task: {task_input}\n"
+    )
+    content = await _cached_chat(user_prompt, model)
+    plan = _tag_steps(_json_loads(content)["steps"])
+    plan_cache.insert(task_input, embedding, plan)
+    return plan
+
+
+async def aupdate_plan_with_input(
+    plan: List[Dict[str, Any]],
+    update_input: str,
+    available_agents: Optional[List[str]] = None,
+    model: str = "gpt-4o-mini",
+) -> List[Dict[str, Any]]:
+    """Revise an existing plan based on new input.
+
+    Args:
+        plan: The current list of phase dicts.
+        update_input: New requirements or feedback to fold in.
+        available_agents: Agent names tasks may be assigned to.
+        model: Chat model to use.
+
+    The plan is sent as a compact id-indexed summary and the
+    model returns patch operations against those ids, so input
+    tokens stay near-constant in the unchanged regions of large
+    plans. If the ops cannot be applied (e.g. an unknown id),
+    the call falls back to resending the full plan.
+
+    Returns:
+        The updated list of phase dicts.
+    """
+    agents_str = _render_agents(
+        tuple(available_agents or ())
+    )
+    tagged = _tag_steps([dict(step) for step in plan])
+    index = [
+        {
+            "id": step["_id"],
+            "phase_name": step["phase_name"],
+            "tasks": [
+                task["description"]
+                for task in step.get("tasks", ())
+            ],
+        }
+        for step in tagged
+    ]
+    user_prompt = (
+        f"Available agents:\n{agents_str}\n\n"
+        "Plan index (patch by id):\n"
+        f"{_json_dumps(index).decode()}\n\n"
+        f"Changed context: {update_input}\n"
+        "Return patch operations for the affected steps only.\n"
+    )
+    content = await _cached_chat(
+        user_prompt, model, _PLAN_OPS_RESPONSE_FORMAT
+    )
+    try:
+        ops = _json_loads(content)["ops"]
+        return _tag_steps(_apply_plan_ops(tagged, ops))
+    except (KeyError, TypeError):
+        return await _aupdate_plan_full(
+            plan, update_input, available_agents, model
+        )
+
+
+async def _aupdate_plan_full(
+    plan: List[Dict[str, Any]],
+    update_input: str,
+    available_agents: Optional[List[str]] = None,
+    model: str = "gpt-4o-mini",
+) -> List[Dict[str, Any]]:
+    """Full-plan fallback: resend everything, receive everything."""
+    agents_str = _render_agents(
+        tuple(available_agents or ())
+    )
+    plan_json = _json_dumps_indented(plan)
+    user_prompt = (
+        f"Available agents:\n{agents_str}\n\n"
+        f"Existing plan:\n{plan_json}\n\n"
+        f"Update input: {update_input}\n"
+    )
+    content = await _cached_chat(user_prompt, model)
+    return _tag_steps(_json_loads(content)["steps"])
+
+
+async def generate_many_plans(
+    tasks: List[str],
+    available_agents: List[str],
+    model: str = "gpt-4o-mini",
+) -> List[List[Dict[str, Any]]]:
+    """Generate plans for several tasks concurrently.
+
+    All chat completions are issued at once and gathered, so a
+    batch costs roughly one round trip rather than one per task.
+
+    Args:
+        tasks: Project descriptions to plan, one plan each.
+        available_agents: Agent names tasks may be assigned to.
+        model: Chat model to use.
+
+    Returns:
+        One phase-dict list per input task, in order.
+    """
+    return await asyncio.gather(
+        *(
+            agenerate_detailed_plan(
+                task, available_agents, model
+            )
+            for task in tasks
+        )
+    )
+
+
+async def _await_batch(batch_id: str, poll_interval: float):
+    """Poll a batch until it reaches a terminal status."""
+    client = _get_async_client()
+    while True:
+        batch = await client.batches.retrieve(batch_id)
+        if batch.status in (
+            "completed",
+            "failed",
+            "expired",
+            "cancelled",
+        ):
+            return batch
+        await asyncio.sleep(poll_interval)
+
+
+async def agenerate_plans_batch(
+    tasks: List[str],
+    available_agents: List[str],
+    model: str = "gpt-4o-mini",
+    poll_interval: float = 30,
+) -> List[Optional[List[Dict[str, Any]]]]:
+    """Generate plans for many tasks via the OpenAI Batch API.
+
+    For offline bulk jobs the Batch API halves the per-token
+    price versus live chat completions in exchange for a
+    turnaround window of up to 24h. All requests go up as one
+    JSONL file and the batch is polled until it completes.
+
+    Args:
+        tasks: Project descriptions to plan, one plan each.
+        available_agents: Agent names tasks may be assigned to.
+        model: Chat model to use.
+        poll_interval: Seconds between batch status polls.
+
+    Returns:
+        One phase-dict list per input task, in order; None for
+        tasks whose request failed within the batch.
+    """
+    agents_str = _render_agents(tuple(available_agents))
+    lines = []
+    for i, task in enumerate(tasks):
+        user_prompt = (
+            f"Available agents:\n{agents_str}\n\n"
+            f"Task: {task}\n"
+        )
+        lines.append(
+            _json_dumps(
+                {
+                    "custom_id": f"task-{i}",
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": {
+                        "model": model,
+                        "messages": [
+                            {
+                                "role": "system",
+                                "content": _PLAN_SYSTEM_PROMPT,
+                            },
+                            {
+                                "role": "user",
+                                "content": user_prompt,
+                            },
+                        ],
+                        "response_format": (
+                            _PLAN_RESPONSE_FORMAT
+                        ),
+                    },
+                }
+            )
+        )
+
+    client = _get_async_client()
+    batch_file = await client.files.create(
+        file=("plans.jsonl", b"\n".join(lines)),
+        purpose="batch",
+    )
+    batch = await client.batches.create(
+        input_file_id=batch_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h",
+    )
+    batch = await _await_batch(batch.id, poll_interval)
+    if batch.status != "completed" or not batch.output_file_id:
+        raise RuntimeError(
+            f"Plan batch {batch.id} finished with status "
+            f"{batch.status}"
+        )
+
+    output = await client.files.content(batch.output_file_id)
+    plans: List[Optional[List[Dict[str, Any]]]] = [
+        None
+    ] * len(tasks)
+    for line in output.content.splitlines():
+        if not line:
+            continue
+        record = _json_loads(line)
+        index = int(record["custom_id"].split("-", 1)[1])
+        body = record.get("response", {}).get("body")
+        if not body:
+            continue
+        content = body["choices"][0]["message"]["content"]
+        plans[index] = _tag_steps(
+            _json_loads(content)["steps"]
+        )
+    return plans
+
+
+def generate_plans_batch(
+    tasks: List[str],
+    available_agents: List[str],
+    model: str = "gpt-4o-mini",
+    poll_interval: float = 30,
+) -> List[Optional[List[Dict[str, Any]]]]:
+    """Sync wrapper around :func:`agenerate_plans_batch`."""
+    return asyncio.run(
+        agenerate_plans_batch(
+            tasks, available_agents, model, poll_interval
+        )
+    )
+
+
+def await_batch(batch_id: str, poll_interval: float = 30):
+    """Block until ``batch_id`` reaches a terminal status."""
+    return asyncio.run(
+        _await_batch(batch_id, poll_interval)
+    )
+
+
+def generate_detailed_plan(
+    task_input: str,
+    available_agents: List[str],
+    model: str = "gpt-4o-mini",
+) -> List[Dict[str, Any]]:
+    """Sync wrapper around :func:`agenerate_detailed_plan`."""
+    return asyncio.run(
+        agenerate_detailed_plan(
+            task_input, available_agents, model
+        )
+    )
+
+
+def update_plan_with_input(
+    plan: List[Dict[str, Any]],
+    update_input: str,
+    available_agents: Optional[List[str]] = None,
+    model: str = "gpt-4o-mini",
+) -> List[Dict[str, Any]]:
+    """Sync wrapper around :func:`aupdate_plan_with_input`."""
+    return asyncio.run(
+        aupdate_plan_with_input(
+            plan, update_input, available_agents, model
+        )
+    )
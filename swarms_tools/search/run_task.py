@@ -0,0 +1,499 @@
+"""Task execution helpers with retry and optional timeout support.
+
+``TaskRunner`` drives a single callable (usually an agent) with
+scheduled start, per-attempt timeout, and exponential-backoff
+retries, returning a structured result dict that downstream tools
+can serialize or log.
+"""
+
+import asyncio
+import logging
+import os
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import (
+    TimeoutError as FuturesTimeout,
+)
+from datetime import datetime, timedelta
+import types
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Mapping,
+    Optional,
+    Tuple,
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+class TaskTimeoutError(Exception):
+    """Raised when a task exceeds its allotted execution time."""
+
+
+# Shared worker pool for every TaskRunner: submitting to a warm
+# pool avoids one thread construction (plus kernel TID allocation)
+# per attempt, and bounds how many leaked timed-out tasks can run
+# at once to the pool size.
+_EXECUTOR = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 4,
+    thread_name_prefix="task_runner",
+)
+
+# Shared immutable defaults: a literal ``{}`` default is one dict
+# allocation per call and a mutation bug waiting to happen (every
+# call shares the same instance). The proxy is read-only, so it is
+# safe to share and ``**kwargs`` unpacking accepts it.
+_EMPTY_ARGS: Tuple = ()
+_EMPTY_KW: Mapping = types.MappingProxyType({})
+
+_BACKOFF_BASE = 1.0
+_BACKOFF_CAP = 30.0
+
+
+def _retry_wait(attempt: int, error: Exception) -> float:
+    """Seconds to wait before retrying after ``error``.
+
+    Uses full-jitter exponential backoff — pure ``2**attempt``
+    sleeps make every task that failed on the same rate-limit
+    instant retry on the same instant again. A ``Retry-After``
+    header on the wrapped error (e.g. openai RateLimitError)
+    takes precedence.
+    """
+    headers = getattr(
+        getattr(error, "response", None), "headers", None
+    )
+    if headers is not None:
+        retry_after = headers.get("Retry-After")
+        if retry_after:
+            try:
+                return float(retry_after)
+            except ValueError:
+                pass
+    return random.uniform(
+        0.0, min(_BACKOFF_CAP, _BACKOFF_BASE * 2**attempt)
+    )
+
+
+class TaskRunner:
+    """Run a callable with retries and an optional timeout.
+
+    Args:
+        task_name: Label used in logs and the result dict.
+        timeout_seconds: Per-attempt timeout; None disables it.
+        max_retries: Number of attempts before giving up.
+        start_time: Optional wall-clock time to delay the first
+            attempt until.
+        quiet: Suppress per-task progress logs (raises the
+            module logger to WARNING).
+    """
+
+    def __init__(
+        self,
+        task_name: str,
+        timeout_seconds: Optional[float] = 300,
+        max_retries: int = 3,
+        start_time: Optional[datetime] = None,
+        quiet: bool = False,
+    ):
+        self.task_name = task_name
+        self.timeout_seconds = timeout_seconds
+        self.max_retries = max_retries
+        self.start_time = start_time
+        self.execution_time = 0.0
+        if quiet:
+            logger.setLevel(logging.WARNING)
+
+    def _delay_until_start(self) -> float:
+        """Seconds left until the scheduled start, floored at 0."""
+        if self.start_time is None:
+            return 0.0
+        return max(
+            0.0,
+            (
+                self.start_time - datetime.now()
+            ).total_seconds(),
+        )
+
+    def _wait_for_start_time(self) -> None:
+        # One wall-clock read to size the delay, then sleep on
+        # the monotonic clock so NTP corrections cannot stretch
+        # or cut the wait.
+        delay = self._delay_until_start()
+        deadline = time.monotonic() + delay
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            time.sleep(min(0.1, remaining))
+
+    def _execute_with_timeout(
+        self,
+        task_func: Callable,
+        args: Optional[Tuple] = None,
+        kwargs: Optional[Mapping] = None,
+    ) -> Any:
+        args = args or _EMPTY_ARGS
+        kwargs = kwargs or _EMPTY_KW
+        # Coroutine functions get an event loop with a native
+        # timeout — running them on a pool thread would just fail
+        # (no loop there), and skipping the pool saves the thread
+        # handoff entirely.
+        if asyncio.iscoroutinefunction(task_func):
+            try:
+                return asyncio.run(
+                    asyncio.wait_for(
+                        task_func(*args, **kwargs),
+                        timeout=self.timeout_seconds,
+                    )
+                )
+            except asyncio.TimeoutError:
+                raise TaskTimeoutError(
+                    f"Task '{self.task_name}' timed out after "
+                    f"{self.timeout_seconds} seconds"
+                ) from None
+        # Cooperative tasks may accept a ``cancel_event`` kwarg;
+        # it is set on timeout so a well-behaved worker can stop
+        # instead of running on in the pool.
+        cancel_event = kwargs.get("cancel_event")
+        future = _EXECUTOR.submit(task_func, *args, **kwargs)
+        try:
+            return future.result(timeout=self.timeout_seconds)
+        except FuturesTimeout:
+            # cancel() only helps if the task has not started
+            # yet; a running task cannot be killed, only asked
+            # to stop.
+            future.cancel()
+            if cancel_event is not None:
+                cancel_event.set()
+            raise TaskTimeoutError(
+                f"Task '{self.task_name}' timed out after "
+                f"{self.timeout_seconds} seconds"
+            ) from None
+
+    def _retry_execution(
+        self,
+        task_func: Callable,
+        args: Optional[Tuple] = None,
+        kwargs: Optional[Mapping] = None,
+    ) -> Any:
+        last_error: Optional[Exception] = None
+        for attempt in range(self.max_retries):
+            try:
+                return self._execute_with_timeout(
+                    task_func, args, kwargs
+                )
+            except TaskTimeoutError:
+                raise
+            except Exception as error:
+                last_error = error
+                logger.warning(
+                    "Task '%s' attempt %d failed: %s",
+                    self.task_name,
+                    attempt + 1,
+                    error,
+                )
+                if attempt + 1 < self.max_retries:
+                    time.sleep(_retry_wait(attempt, error))
+        raise last_error
+
+    def run(
+        self,
+        task_func: Callable,
+        args: Optional[Tuple] = None,
+        kwargs: Optional[Mapping] = None,
+    ) -> Dict[str, Any]:
+        """Execute ``task_func`` and return a result dict.
+
+        Returns:
+            Dict with ``task_name``, ``status``, ``result``,
+            ``error``, timing fields, and ``execution_time``.
+        """
+        logger.info("Running task '%s'", self.task_name)
+        # Durations come from the monotonic clock (immune to NTP
+        # skew and much cheaper than datetime.now()); wall-clock
+        # timestamps are derived once at the end.
+        scheduled_ns = time.monotonic_ns()
+        self._wait_for_start_time()
+        started_ns = time.monotonic_ns()
+        try:
+            value = self._retry_execution(task_func, args, kwargs)
+            status = "success"
+            error = None
+        except Exception as run_error:
+            value = None
+            status = "failed"
+            error = str(run_error)
+            logger.error(
+                "Task '%s' failed: %s",
+                self.task_name,
+                run_error,
+            )
+        finished_ns = time.monotonic_ns()
+        self.execution_time = (
+            finished_ns - started_ns
+        ) / 1e9
+        finished_at = datetime.now()
+        started_at = finished_at - timedelta(
+            seconds=self.execution_time
+        )
+        scheduled_at = finished_at - timedelta(
+            seconds=(finished_ns - scheduled_ns) / 1e9
+        )
+        logger.info(
+            "Task '%s' finished with status %s in %.2fs",
+            self.task_name,
+            status,
+            self.execution_time,
+        )
+        return self._create_result(
+            value, status, error, scheduled_at, started_at,
+            finished_at,
+        )
+
+    async def arun(
+        self,
+        agent: Callable,
+        task_description: str,
+        args: Optional[Tuple] = None,
+        kwargs: Optional[Mapping] = None,
+    ) -> Dict[str, Any]:
+        """Async counterpart of :meth:`run` for agent tasks.
+
+        Natively async agents are awaited directly; sync agents
+        are pushed to a worker thread via ``asyncio.to_thread``
+        so they never block the event loop. Many ``arun`` calls
+        can therefore be gathered, making N independent agent
+        calls cost roughly the slowest one instead of their sum.
+
+        Returns:
+            The same result dict shape as :meth:`run`.
+        """
+        logger.info("Running task '%s'", self.task_name)
+        scheduled_ns = time.monotonic_ns()
+        delay = self._delay_until_start()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        started_ns = time.monotonic_ns()
+        try:
+            value = await _acall_agent(
+                agent,
+                task_description,
+                args or _EMPTY_ARGS,
+                kwargs or _EMPTY_KW,
+            )
+            status = "success"
+            error = None
+        except Exception as run_error:
+            value = None
+            status = "failed"
+            error = str(run_error)
+            logger.error(
+                "Task '%s' failed: %s",
+                self.task_name,
+                run_error,
+            )
+        finished_ns = time.monotonic_ns()
+        self.execution_time = (
+            finished_ns - started_ns
+        ) / 1e9
+        finished_at = datetime.now()
+        started_at = finished_at - timedelta(
+            seconds=self.execution_time
+        )
+        scheduled_at = finished_at - timedelta(
+            seconds=(finished_ns - scheduled_ns) / 1e9
+        )
+        logger.info(
+            "Task '%s' finished with status %s in %.2fs",
+            self.task_name,
+            status,
+            self.execution_time,
+        )
+        return self._create_result(
+            value, status, error, scheduled_at, started_at,
+            finished_at,
+        )
+
+    def _create_result(
+        self,
+        value: Any,
+        status: str,
+        error: Optional[str],
+        scheduled_at: datetime,
+        started_at: datetime,
+        finished_at: datetime,
+    ) -> Dict[str, Any]:
+        return {
+            "task_name": self.task_name,
+            "status": status,
+            "result": value,
+            "error": error,
+            "scheduled_at": scheduled_at.isoformat(),
+            "started_at": started_at.isoformat(),
+            "finished_at": finished_at.isoformat(),
+            "execution_time": self.execution_time,
+        }
+
+
+async def _acall_agent(
+    agent: Callable,
+    task_description: str,
+    args: Tuple,
+    kwargs: Dict,
+) -> Any:
+    """Dispatch to an agent on its most async-capable interface."""
+    if asyncio.iscoroutinefunction(agent):
+        return await agent(task_description, *args, **kwargs)
+    for method_name in ("arun", "acall"):
+        method = getattr(agent, method_name, None)
+        if method is not None and asyncio.iscoroutinefunction(
+            method
+        ):
+            return await method(
+                task_description, *args, **kwargs
+            )
+    # Sync agent: run it in a worker thread so awaiting callers
+    # (and their sibling tasks) keep making progress.
+    return await asyncio.to_thread(
+        agent, task_description, *args, **kwargs
+    )
+
+
+def run_task_with_timeout(
+    task_func: Callable,
+    task_name: Optional[str] = None,
+    timeout_seconds: float = 300,
+    max_retries: int = 3,
+    args: Optional[Tuple] = None,
+    kwargs: Optional[Mapping] = None,
+) -> Dict[str, Any]:
+    """Run ``task_func`` with a per-attempt timeout.
+
+    Returns:
+        The :meth:`TaskRunner.run` result dict.
+    """
+    runner = TaskRunner(
+        task_name
+        or getattr(task_func, "__name__", "anonymous_task"),
+        timeout_seconds=timeout_seconds,
+        max_retries=max_retries,
+    )
+    return runner.run(task_func, args, kwargs)
+
+
+def run_task_without_timeout(
+    agent: Callable,
+    task_description: str,
+    args: Optional[Tuple] = None,
+    kwargs: Optional[Mapping] = None,
+) -> Dict[str, Any]:
+    """Run an agent task to completion without a timeout.
+
+    Args:
+        agent: Callable agent invoked as
+            ``agent(task_description, *args, **kwargs)``.
+        task_description: Task text passed to the agent; also used
+            as the task name.
+
+    Returns:
+        The :meth:`TaskRunner.run` result dict.
+    """
+    runner = TaskRunner(
+        task_name=task_description,
+        timeout_seconds=None,
+        max_retries=1,
+    )
+    return runner.run(
+        agent,
+        (task_description, *(args or _EMPTY_ARGS)),
+        kwargs,
+    )
+
+
+async def arun_task(
+    agent: Callable,
+    task_description: str,
+    args: Optional[Tuple] = None,
+    kwargs: Optional[Mapping] = None,
+) -> Dict[str, Any]:
+    """Async variant of :func:`run_task_without_timeout`.
+
+    Awaitable agents are awaited natively; sync ones run in a
+    worker thread. Gather several of these to overlap agent I/O.
+
+    Returns:
+        The :meth:`TaskRunner.arun` result dict.
+    """
+    runner = TaskRunner(
+        task_name=task_description,
+        timeout_seconds=None,
+        max_retries=1,
+    )
+    return await runner.arun(
+        agent, task_description, args, kwargs
+    )
+
+
+async def arun_tasks_stream(
+    task_specs: Tuple,
+) -> AsyncIterator[Dict[str, Any]]:
+    """Run many agent tasks and yield results as they finish.
+
+    Unlike gathering, each result dict is delivered the moment
+    its task completes, so downstream consumers see the fast
+    tasks immediately instead of waiting for the slowest one.
+
+    Args:
+        task_specs: Iterable of ``(agent, task_description)``
+            tuples, optionally extended with ``args`` and
+            ``kwargs`` entries, matching :func:`arun_task`.
+
+    Yields:
+        Result dicts in completion order.
+    """
+    tasks = [
+        asyncio.ensure_future(arun_task(*spec))
+        for spec in task_specs
+    ]
+    for future in asyncio.as_completed(tasks):
+        yield await future
+
+
+def run_tasks_without_timeout(
+    task_specs: Tuple,
+    on_result: Optional[
+        Callable[[Dict[str, Any]], None]
+    ] = None,
+) -> Tuple[Dict[str, Any], ...]:
+    """Run many agent tasks concurrently and collect results.
+
+    Args:
+        task_specs: Iterable of ``(agent, task_description)``
+            tuples, optionally extended with ``args`` and
+            ``kwargs`` entries, matching :func:`arun_task`.
+        on_result: Optional callback invoked with each result
+            dict as soon as its task finishes, ahead of the
+            batch completing.
+
+    Returns:
+        One result dict per spec; in input order without
+        ``on_result``, in completion order with it.
+    """
+
+    async def _gather():
+        if on_result is None:
+            return await asyncio.gather(
+                *(arun_task(*spec) for spec in task_specs)
+            )
+        results = []
+        async for result in arun_tasks_stream(task_specs):
+            on_result(result)
+            results.append(result)
+        return results
+
+    return asyncio.run(_gather())
@@ -0,0 +1,211 @@
+"""Record a scrolling walkthrough of a web page as a video.
+
+Drives a headless Chrome instance down the page while appending
+frames to an OpenCV ``VideoWriter``. For static pages the whole
+page is rendered and decoded once and every frame is just a NumPy
+slice at the current scroll offset; dynamic pages fall back to live
+Chrome DevTools Protocol JPEG capture (``Page.captureScreenshot``),
+which still skips the lossless PNG encode of Selenium's screenshot
+API and cuts per-frame transport bytes by roughly 5-10x.
+"""
+
+import atexit
+import binascii
+import threading
+import time
+from typing import Optional
+
+import cv2
+import numpy as np
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+
+_JPEG_QUALITY = 70
+
+# One Chrome process shared across calls: process launch + profile
+# init costs ~1-2s, which dominates batch recording sessions.
+_driver_lock = threading.Lock()
+_driver: Optional[webdriver.Chrome] = None
+
+
+def _shutdown_driver() -> None:
+    global _driver
+    if _driver is not None:
+        _driver.quit()
+        _driver = None
+
+
+def _get_driver(width: int, height: int) -> "webdriver.Chrome":
+    """Lazily construct and reuse a single headless Chrome.
+
+    The window size is fixed by the first caller; recordings run in
+    their own tab, so concurrent sizes are not supported.
+    """
+    global _driver
+    with _driver_lock:
+        if _driver is None:
+            options = Options()
+            options.add_argument("--headless=new")
+            options.add_argument(
+                f"--window-size={width},{height}"
+            )
+            _driver = webdriver.Chrome(options=options)
+            atexit.register(_shutdown_driver)
+        return _driver
+
+
+def _decode_jpeg(data_b64: str) -> Optional[np.ndarray]:
+    # a2b_base64 is the C fast path under base64.b64decode;
+    # frombuffer wraps the result without copying.
+    return cv2.imdecode(
+        np.frombuffer(
+            binascii.a2b_base64(data_b64), np.uint8
+        ),
+        cv2.IMREAD_COLOR,
+    )
+
+
+def _capture_full_page(
+    driver: "webdriver.Chrome", width: int
+) -> Optional[np.ndarray]:
+    """Render the entire page once and decode it to a single array."""
+    metrics = driver.execute_cdp_cmd("Page.getLayoutMetrics", {})
+    total_height = int(
+        metrics.get("contentSize", {}).get("height", 0)
+    )
+    if total_height <= 0:
+        return None
+    shot = driver.execute_cdp_cmd(
+        "Page.captureScreenshot",
+        {
+            "format": "jpeg",
+            "quality": _JPEG_QUALITY,
+            "captureBeyondViewport": True,
+            "clip": {
+                "x": 0,
+                "y": 0,
+                "width": width,
+                "height": total_height,
+                "scale": 1,
+            },
+        },
+    )
+    return _decode_jpeg(shot["data"])
+
+
+def scroll_and_record(
+    url: str,
+    output_path: str = "recording.mp4",
+    duration: float = 10.0,
+    scroll_interval: float = 0.05,
+    scroll_step: int = 40,
+    width: int = 1920,
+    height: int = 1080,
+    assume_static: bool = True,
+) -> str:
+    """Scroll through ``url`` and record the viewport to a video.
+
+    Args:
+        url: Page to record.
+        output_path: Destination video file (mp4).
+        duration: Total recording time in seconds.
+        scroll_interval: Delay between frames/scroll steps; the
+            video FPS is derived from it.
+        scroll_step: Pixels scrolled per frame.
+        width: Browser window width.
+        height: Browser window height.
+        assume_static: When True (default), render the page once
+            and compose frames as slices of the full-page capture
+            - a memcpy per frame instead of a browser round-trip
+            plus JPEG decode. Set False for pages with animated or
+            lazily-loaded content.
+
+    Returns:
+        The path of the written video file.
+    """
+    driver = _get_driver(width, height)
+    driver.switch_to.new_window("tab")
+    try:
+        driver.get(url)
+        # round, not int(): truncation turns any scroll_interval
+        # above 1.0 into fps == 0, which VideoWriter rejects,
+        # silently producing an unplayable file.
+        fps = max(1, round(1 / scroll_interval))
+        fourcc = cv2.VideoWriter_fourcc(*"mp4v")
+        num_frames = int(duration / scroll_interval)
+
+        if assume_static:
+            full = _capture_full_page(driver, width)
+            if full is not None and full.shape[0] > height:
+                frame_h, frame_w = height, full.shape[1]
+                writer = cv2.VideoWriter(
+                    output_path, fourcc, fps, (frame_w, frame_h)
+                )
+                if not writer.isOpened():
+                    raise RuntimeError(
+                        "Could not open video writer for "
+                        f"{output_path}"
+                    )
+                max_scroll = full.shape[0] - height
+                current_scroll = 0
+                for _ in range(num_frames):
+                    offset = min(current_scroll, max_scroll)
+                    # Pure slice of the decoded page: no capture,
+                    # no imdecode per frame.
+                    writer.write(
+                        full[offset : offset + height]
+                    )
+                    current_scroll += scroll_step
+                writer.release()
+                return output_path
+
+        # Live path: per-frame CDP JPEG capture. The request dict,
+        # frame shape, and writer are all fixed before the hot
+        # loop via a probe frame.
+        capture_params = {
+            "format": "jpeg",
+            "quality": _JPEG_QUALITY,
+        }
+        writer = None
+        probe = _decode_jpeg(
+            driver.execute_cdp_cmd(
+                "Page.captureScreenshot", capture_params
+            )["data"]
+        )
+        if probe is not None:
+            frame_h, frame_w = probe.shape[:2]
+            writer = cv2.VideoWriter(
+                output_path, fourcc, fps, (frame_w, frame_h)
+            )
+            if not writer.isOpened():
+                raise RuntimeError(
+                    "Could not open video writer for "
+                    f"{output_path}"
+                )
+            writer.write(probe)
+        current_scroll = 0
+        start = time.time()
+        while writer is not None and (
+            time.time() - start < duration
+        ):
+            shot = driver.execute_cdp_cmd(
+                "Page.captureScreenshot", capture_params
+            )
+            frame = _decode_jpeg(shot["data"])
+            if frame is None:
+                continue
+            writer.write(frame)
+            current_scroll += scroll_step
+            driver.execute_script(
+                f"window.scrollTo(0, {current_scroll});"
+            )
+            time.sleep(scroll_interval)
+        if writer is not None:
+            writer.release()
+    finally:
+        # Close only this recording's tab; the browser process
+        # stays warm for the next call.
+        driver.close()
+        if driver.window_handles:
+            driver.switch_to.window(driver.window_handles[0])
+    return output_path
@@ -1,3 +1,30 @@
+import mmap
+import os
+import shutil
+import tempfile
+
+
+def _atomic_write(file_path: str, data: bytes) -> None:
+    """Write ``data`` to ``file_path`` atomically.
+
+    The bytes go to a temp file in the same directory (one
+    contiguous sequential write + fsync), which is then renamed
+    over the target with ``os.replace`` — atomic on POSIX and
+    NTFS, so a crash leaves either the old file or the new one,
+    never a truncated in-between. Mode bits are preserved.
+    """
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(file_path) or "."
+    )
+    try:
+        os.write(fd, data)
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    shutil.copymode(file_path, tmp_path)
+    os.replace(tmp_path, file_path)
+
+
 def modify_file_content(
     file_path: str,
     old_content: str,
@@ -6,6 +33,13 @@ def modify_file_content(
     """
     Efficiently modify ONLY the specified string content in a file.
 
+    The file is memory-mapped and searched as bytes (``mmap.find``
+    uses the C memmem fast path), so the common same-length
+    replacement dirties only the touched pages in place instead of
+    decoding, rebuilding, and rewriting the whole file. When the
+    replacement changes the length, only the region from the first
+    match onward is rewritten.
+
     Args:
         file_path (str): Path to the file to modify.
         old_content (str): The old string to be replaced (must be a string).
@@ -15,19 +49,44 @@ def modify_file_content(
         str: A message indicating the result of the operation.
     """
     try:
-        # Read the current file contents
-        with open(file_path, 'r') as file:
-            content = file.read()
-
-        # Replace the old content with the new content
-        if old_content not in content:
-            return f"Old content not found in {file_path}."
+        # Stay in bytes end to end: no UTF-8 decode/re-encode of
+        # the unchanged bulk of the file.
+        old_bytes = old_content.encode()
+        new_bytes = new_content.encode()
 
-        modified_content = content.replace(old_content, new_content)
+        fd = os.open(file_path, os.O_RDWR)
+        try:
+            # mmap refuses zero-length files; an empty file
+            # simply cannot contain old_content.
+            if os.fstat(fd).st_size == 0:
+                return f"Old content not found in {file_path}."
+            with mmap.mmap(fd, 0) as mm:
+                idx = mm.find(old_bytes)
+                if idx == -1:
+                    return f"Old content not found in {file_path}."
 
-        # Write back to the file
-        with open(file_path, 'w') as file:
-            file.write(modified_content)
+                if len(new_bytes) == len(old_bytes):
+                    # In-place patch of every occurrence; only the
+                    # modified pages are written back.
+                    while idx != -1:
+                        mm[idx:idx + len(old_bytes)] = new_bytes
+                        idx = mm.find(
+                            old_bytes, idx + len(new_bytes)
+                        )
+                    mm.flush()
+                else:
+                    # Length changed: the file must be rewritten,
+                    # so build the new contents and swap them in
+                    # atomically rather than truncating in place
+                    # (a crash mid-write would otherwise corrupt
+                    # or lose the file).
+                    modified = mm[:idx] + mm[idx:].replace(
+                        old_bytes, new_bytes
+                    )
+        finally:
+            os.close(fd)
+        if len(new_bytes) != len(old_bytes):
+            _atomic_write(file_path, modified)
 
         message = (
             f"Transfer complete: Updated {file_path}.\n"
@@ -40,9 +99,62 @@ def modify_file_content(
         print(error_message)
         return error_message
 
+def modify_file_content_many(
+    file_path: str,
+    edits: list
+) -> dict:
+    """
+    Apply many ``(old_content, new_content)`` edits in one pass.
+
+    Sequential calls to ``modify_file_content`` cost one full
+    read + write per edit; this reads the file once, applies
+    every edit in order against the in-memory bytes, and writes
+    the result back once (atomically). Each edit replaces the
+    first occurrence only, so edits can safely build on each
+    other.
+
+    Args:
+        file_path (str): Path to the file to modify.
+        edits (list): ``(old_content, new_content)`` string pairs,
+            applied in order.
+
+    Returns:
+        dict: ``{"applied": [...], "missing": [...]}`` listing the
+            ``old_content`` of each edit that was applied or not
+            found.
+    """
+    try:
+        with open(file_path, 'rb') as file:
+            content = file.read()
+
+        applied = []
+        missing = []
+        for old_content, new_content in edits:
+            old_bytes = old_content.encode()
+            if old_bytes not in content:
+                missing.append(old_content)
+                continue
+            content = content.replace(
+                old_bytes, new_content.encode(), 1
+            )
+            applied.append(old_content)
+
+        if applied:
+            _atomic_write(file_path, content)
+        print(
+            f"Updated {file_path}: {len(applied)} edits applied, "
+            f"{len(missing)} not found"
+        )
+        return {"applied": applied, "missing": missing}
+    except Exception as e:
+        error_message = f"Failed to update {file_path}: {str(e)}"
+        print(error_message)
+        return {"applied": [], "missing": [], "error": error_message}
+
+
 # # Example usage
 # if __name__ == '__main__':
 #     file_path = '/Users/akshparekh/Documents/swarms-tools/exa_search_api.py'
 #     old_content = '"What are the best performing semiconductor stocks?"'
 #     new_content = '"What are the top AI semiconductor companies?"'
-#     modify_file_content(file_path, old_content, new_content)
\ No newline at end of file
+#     modify_file_content(file_path, old_content, new_content)
@@ -0,0 +1,620 @@
+"""Task management primitives for multi-agent todo.md workflows.
+
+Provides the ``Task``/``Phase``/``TaskPlan`` models, a ``TaskManager``
+index over a plan, and helpers to materialize a plan as a ``todo.md``
+file that agents can read and update as they work through phases.
+"""
+
+import hashlib
+import itertools
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from pydantic import BaseModel, PrivateAttr
+
+logger = logging.getLogger(__name__)
+
+
+# Task is a slotted dataclass rather than a pydantic model: one
+# instance exists per planned task (potentially thousands) and its
+# attributes are read in every render and completion loop, where
+# slot access is several times faster and hundreds of bytes
+# smaller per instance than a model __dict__. Validation still
+# happens where the data enters the system — pydantic coerces
+# these when they appear as Phase/TaskPlan fields.
+@dataclass(slots=True)
+class Task:
+    """A single unit of work assigned to an agent."""
+
+    id: str
+    description: str
+    agent: Optional[str] = None
+    completed: bool = False
+    line_number: Optional[int] = None
+    args: tuple = ()
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+    # Rendered line minus the checkbox, built once: description
+    # and agent are effectively immutable after construction, and
+    # renders touch every task, so the per-call f-string and
+    # attribute fetches add up on large plans.
+    _suffix: str = field(
+        init=False, repr=False, default=""
+    )
+
+    def __post_init__(self) -> None:
+        self._suffix = (
+            f" {self.description}"
+            f" ##AGENT:{self.agent or 'None'}##"
+        )
+
+    def display_with_checkbox(self) -> str:
+        """Render the task as a todo.md checkbox line."""
+        return (
+            "[X]" if self.completed else "[ ]"
+        ) + self._suffix
+
+
+class Phase(BaseModel):
+    """An ordered group of tasks; phases run sequentially."""
+
+    id: str
+    phase_name: str
+    tasks: List[Task] = []
+    is_active: bool = False
+    # Ids of phases that must finish before this one starts.
+    # Empty means "the previous phase" (the historical linear
+    # chain); independent phases can list a common ancestor to
+    # run concurrently.
+    depends_on: List[str] = []
+    # Markdown header built once: invariant across renders, like
+    # Task._suffix.
+    _header: str = PrivateAttr(default="")
+
+    def model_post_init(self, __context: Any) -> None:
+        self._header = f"## {self.phase_name}"
+
+    def display_tasks(self) -> List[str]:
+        """Render every task in the phase as checkbox lines."""
+        # map() over the unbound method skips one interpreter
+        # frame per task versus a list comprehension.
+        return list(
+            map(Task.display_with_checkbox, self.tasks)
+        )
+
+
+class TaskPlan(BaseModel):
+    """A full project plan: named phases plus completion state."""
+
+    project_name: str
+    phases: List[Phase] = []
+    overall_completion: float = 0.0
+    # O(1) phase lookup; kept in sync by the todo.md loader.
+    phases_by_name: Dict[str, Phase] = {}
+    _header: str = PrivateAttr(default="")
+    # Lazily built TaskManager (see _get_manager). Lives on the
+    # plan so both die together; a module-level cache would keep
+    # every plan alive for the process lifetime.
+    _manager: Any = PrivateAttr(default=None)
+
+    def model_post_init(self, __context: Any) -> None:
+        self._header = f"# {self.project_name}"
+
+
+class TaskManager:
+    """Index over a :class:`TaskPlan` for task lookup and polling."""
+
+    def __init__(
+        self,
+        task_plan: TaskPlan,
+        todo_md_path: Optional[str] = None,
+    ):
+        self.task_plan = task_plan
+        # Resolved once: os.getcwd() is a syscall, and the hot
+        # update path otherwise re-derives the same default path
+        # on every call.
+        self.todo_md_path = todo_md_path or os.path.join(
+            os.getcwd(), "todo.md"
+        )
+        self.task_index: Dict[str, Tuple[int, Task]] = {}
+        # Open-task counters, maintained incrementally so
+        # completion checks are O(1) instead of re-scanning every
+        # task (each scan is a pile of pydantic attribute reads).
+        self._remaining: Dict[int, int] = {}
+        self._total_tasks = 0
+        self._total_remaining = 0
+        # Per-agent FIFO of open tasks in active phases, so agent
+        # polls are O(1) instead of a full phase/task scan.
+        self._by_agent: Dict[str, deque] = defaultdict(deque)
+        self._active_phase_idx = 0
+        # Byte offsets into the last fully rendered todo.md:
+        # task id -> offset of the checkbox state character, plus
+        # the offset/length of the completion footer. Lets a
+        # single-task toggle patch 1 + len(footer) bytes in place
+        # instead of re-rendering and rewriting the whole file.
+        self._checkbox_offsets: Dict[str, int] = {}
+        self._pct_offset = -1
+        self._pct_len = -1
+        self._offsets_path: Optional[str] = None
+        self._build_index()
+
+    def _build_index(self) -> None:
+        # Idempotent: reused managers must not re-walk the plan.
+        if self.task_index:
+            return
+        phases = self.task_plan.phases
+        for phase_idx, phase in enumerate(phases):
+            open_count = 0
+            for task in phase.tasks:
+                self.task_index[task.id] = (phase_idx, task)
+                if not task.completed:
+                    open_count += 1
+            self._remaining[phase_idx] = open_count
+            self._total_tasks += len(phase.tasks)
+            self._total_remaining += open_count
+
+        # Phase dependency DAG, built once. Phases without an
+        # explicit depends_on fall back to the historical linear
+        # chain; phases sharing predecessors become ready
+        # together, so agents on independent phases don't block
+        # on each other.
+        id_to_idx = {
+            phase.id: idx for idx, phase in enumerate(phases)
+        }
+        self._phase_preds: List[List[int]] = []
+        self._phase_succs: List[List[int]] = [
+            [] for _ in phases
+        ]
+        for phase_idx, phase in enumerate(phases):
+            if phase.depends_on:
+                preds = [
+                    id_to_idx[dep]
+                    for dep in phase.depends_on
+                    if dep in id_to_idx
+                ]
+            else:
+                preds = [phase_idx - 1] if phase_idx else []
+            self._phase_preds.append(preds)
+            for pred in preds:
+                self._phase_succs[pred].append(phase_idx)
+        # Completed predecessors don't gate readiness.
+        self._phase_pending_preds: List[int] = [
+            sum(
+                1
+                for pred in preds
+                if self._remaining[pred] > 0
+            )
+            for preds in self._phase_preds
+        ]
+
+        for phase_idx, phase in enumerate(phases):
+            ready = (
+                self._phase_pending_preds[phase_idx] == 0
+                and self._remaining[phase_idx] > 0
+            )
+            if ready and not phase.is_active:
+                phase.is_active = True
+            if ready or phase.is_active:
+                self._enqueue_phase(phase)
+        self._active_phase_idx = next(
+            (
+                idx
+                for idx, phase in enumerate(phases)
+                if phase.is_active
+            ),
+            0,
+        )
+
+    def _enqueue_phase(self, phase: Phase) -> None:
+        """Queue a phase's open, assigned tasks per agent."""
+        for task in phase.tasks:
+            if not task.completed and task.agent:
+                self._by_agent[task.agent].append(task)
+
+    def set_completed(
+        self, phase_idx: int, task: Task, completed: bool
+    ) -> bool:
+        """Toggle a task's state, keeping counters in sync.
+
+        Returns:
+            True when the state actually changed.
+        """
+        if task.completed == completed:
+            return False
+        task.completed = completed
+        delta = -1 if completed else 1
+        self._remaining[phase_idx] += delta
+        self._total_remaining += delta
+        return True
+
+    def get_task(
+        self, task_id: str
+    ) -> Optional[Tuple[int, Task]]:
+        """Return ``(phase_index, task)`` for a task id, if known."""
+        return self.task_index.get(task_id)
+
+    def get_next_available_task(
+        self, agent: str
+    ) -> Optional[Task]:
+        """Return the first open task assigned to ``agent``.
+
+        Reads the agent's queue head; tasks completed since they
+        were queued are discarded lazily here, keeping both polls
+        and completions O(1) amortized.
+        """
+        queue = self._by_agent.get(agent)
+        while queue:
+            task = queue[0]
+            if task.completed:
+                queue.popleft()
+                continue
+            return task
+        return None
+
+    def _on_phase_ready(self, phase_idx: int) -> None:
+        """Activate a phase whose predecessors all finished.
+
+        Empty or already-complete phases contribute no work, so
+        their readiness cascades straight through to their own
+        successors.
+        """
+        if self._remaining[phase_idx] > 0:
+            phase = self.task_plan.phases[phase_idx]
+            phase.is_active = True
+            self._active_phase_idx = phase_idx
+            self._enqueue_phase(phase)
+            return
+        for succ in self._phase_succs[phase_idx]:
+            self._phase_pending_preds[succ] -= 1
+            if self._phase_pending_preds[succ] == 0:
+                self._on_phase_ready(succ)
+
+    def _check_phase_completion(self, phase_idx: int) -> bool:
+        """Deactivate a finished phase and release successors.
+
+        Fires only on the open-count 0-transition edge (the phase
+        is still marked active), so repeated calls after
+        completion do not re-activate successors. Every dependent
+        phase whose predecessor count drops to zero becomes
+        active — possibly several at once when the DAG branches.
+        """
+        phase = self.task_plan.phases[phase_idx]
+        if (
+            self._remaining[phase_idx] == 0
+            and phase.is_active
+        ):
+            phase.is_active = False
+            for succ in self._phase_succs[phase_idx]:
+                self._phase_pending_preds[succ] -= 1
+                if self._phase_pending_preds[succ] == 0:
+                    self._on_phase_ready(succ)
+            return True
+        return False
+
+    def _check_project_completion(self) -> bool:
+        """Return True when every task in every phase is done."""
+        return self._total_remaining == 0
+
+    def compute_overall_completion(self) -> float:
+        """Percentage of completed tasks across the whole plan."""
+        if not self._total_tasks:
+            return 0.0
+        done = self._total_tasks - self._total_remaining
+        return done / self._total_tasks * 100
+
+
+# One manager per live plan: building the task index walks every
+# phase and task, which is pure waste when repeated on each
+# completion update. The manager hangs off the plan itself so the
+# plan<->manager cycle is collected as one unit once the caller
+# drops the plan; a module-level cache kept plans reachable (and
+# therefore every manager ever built) for the process lifetime.
+def _get_manager(task_plan: TaskPlan) -> "TaskManager":
+    """Return the plan's manager, building it on first use."""
+    manager = task_plan._manager
+    if manager is None:
+        manager = TaskManager(task_plan)
+        task_plan._manager = manager
+    return manager
+
+
+def _phase_lines(phases: List[Phase]):
+    """Yield the ``## phase`` header and task lines per phase."""
+    for phase in phases:
+        yield phase._header
+        for task in phase.tasks:
+            yield (
+                "[X]" if task.completed else "[ ]"
+            ) + task._suffix
+        yield ""
+
+
+def _render_todo_md(
+    task_plan: TaskPlan, completion: float
+) -> str:
+    """Render a plan to todo.md text in one join.
+
+    A single ``"\n".join`` over chained generators builds the
+    whole document without growing an intermediate line list.
+    """
+    return "\n".join(
+        itertools.chain(
+            (task_plan._header, ""),
+            _phase_lines(task_plan.phases),
+            (
+                f"**Overall Completion: {completion:.1f}%**",
+                "",
+            ),
+        )
+    )
+
+
+# blake2b digest of the last content written per path; hashing
+# runs at ~GB/s, far cheaper than a filesystem round-trip, so
+# byte-identical rewrites (common under idempotent agent polling)
+# skip the disk entirely.
+_last_md_hash: Dict[str, bytes] = {}
+
+
+def _write_todo_md(todo_md_path: str, content: str) -> None:
+    """Write todo.md atomically, skipping no-op rewrites.
+
+    The bytes land in ``todo.md.tmp.<pid>`` first and are renamed
+    over the target with ``os.replace``, so concurrently polling
+    agents always read either the old or the new document, never
+    a torn half-write. Content identical to the previous write is
+    not written again.
+    """
+    data = content.encode("utf-8")
+    digest = hashlib.blake2b(data, digest_size=16).digest()
+    if _last_md_hash.get(
+        todo_md_path
+    ) == digest and os.path.exists(todo_md_path):
+        return
+    tmp_path = f"{todo_md_path}.tmp.{os.getpid()}"
+    Path(tmp_path).write_bytes(data)
+    os.replace(tmp_path, todo_md_path)
+    _last_md_hash[todo_md_path] = digest
+
+
+def _index_md_offsets(
+    manager: TaskManager,
+    task_plan: TaskPlan,
+    content: str,
+    todo_md_path: str,
+) -> None:
+    """Record byte offsets of each checkbox and the footer.
+
+    Walks the rendered document once, pairing checkbox lines with
+    the plan's tasks in render order, so later single-task
+    updates can seek straight to the bytes that change.
+    """
+    offsets: Dict[str, int] = {}
+    tasks = itertools.chain.from_iterable(
+        phase.tasks for phase in task_plan.phases
+    )
+    offset = 0
+    for line in content.split("\n"):
+        line_len = len(line.encode("utf-8"))
+        if line.startswith(("[ ]", "[X]")):
+            # "[ " is two bytes; the state char sits at +1.
+            offsets[next(tasks).id] = offset + 1
+        elif line.startswith("**Overall Completion:"):
+            manager._pct_offset = offset
+            manager._pct_len = line_len
+        offset += line_len + 1
+    manager._checkbox_offsets = offsets
+    manager._offsets_path = todo_md_path
+
+
+def _patch_todo_md(
+    manager: TaskManager,
+    todo_md_path: str,
+    task: Task,
+    completion: float,
+) -> bool:
+    """Patch one checkbox and the footer in place.
+
+    Returns True when the file was updated with two targeted
+    ``r+b`` writes; False when no offset table covers this path
+    or the footer changed length, in which case the caller must
+    fall back to a full render.
+    """
+    if manager._offsets_path != todo_md_path:
+        return False
+    offset = manager._checkbox_offsets.get(task.id)
+    if offset is None:
+        return False
+    footer = (
+        f"**Overall Completion: {completion:.1f}%**"
+    ).encode("utf-8")
+    if len(footer) != manager._pct_len:
+        return False
+    try:
+        with open(todo_md_path, "r+b") as f:
+            f.seek(offset)
+            f.write(b"X" if task.completed else b" ")
+            f.seek(manager._pct_offset)
+            f.write(footer)
+    except OSError:
+        return False
+    # The on-disk bytes no longer match the last full render;
+    # drop the digest so the next full write is not skipped.
+    _last_md_hash.pop(todo_md_path, None)
+    return True
+
+
+def task_planner(
+    project_name: str,
+    phase_dicts: List[Dict[str, Any]],
+) -> TaskPlan:
+    """Build a :class:`TaskPlan` from plain phase dictionaries.
+
+    Args:
+        project_name: Human-readable project title.
+        phase_dicts: Each dict needs a ``phase_name`` and a
+            ``tasks`` list of ``{"description": ..., "agent": ...}``
+            entries. An optional ``depends_on`` list names the
+            phases that must finish before this one starts;
+            omitted, the phase depends on the one before it.
+
+    Returns:
+        The validated plan with the first phase marked active.
+    """
+    # One urandom read covers every id: per-object uuid4() costs
+    # a CSPRNG draw plus version-bit fixup each, which dominates
+    # task_planner on large plans. 16 random bytes hex-encoded
+    # carry the same entropy.
+    num_ids = len(phase_dicts) + sum(
+        len(phase_dict.get("tasks", []))
+        for phase_dict in phase_dicts
+    )
+    raw = os.urandom(16 * num_ids)
+    ids = (
+        raw[offset : offset + 16].hex()
+        for offset in range(0, 16 * num_ids, 16)
+    )
+
+    phases: List[Phase] = []
+    phase_ids: Dict[str, str] = {}
+    for phase_idx, phase_dict in enumerate(phase_dicts):
+        tasks = [
+            Task(
+                id=next(ids),
+                description=task_dict["description"],
+                agent=task_dict.get("agent"),
+            )
+            for task_dict in phase_dict.get("tasks", [])
+        ]
+        phase_id = next(ids)
+        phase_ids[phase_dict["phase_name"]] = phase_id
+        phases.append(
+            Phase(
+                id=phase_id,
+                phase_name=phase_dict["phase_name"],
+                tasks=tasks,
+                is_active=phase_idx == 0,
+            )
+        )
+    # Second pass: declared dependencies name phases (ids are
+    # generated here, so callers can't know them), and may
+    # reference phases declared later. Unknown names are dropped,
+    # matching the DAG builder's handling of unknown ids.
+    for phase, phase_dict in zip(phases, phase_dicts):
+        phase.depends_on = [
+            phase_ids[name]
+            for name in phase_dict.get("depends_on", [])
+            if name in phase_ids
+        ]
+    return TaskPlan(project_name=project_name, phases=phases)
+
+
+def generate_todo_md(
+    task_plan: TaskPlan,
+    todo_md_path: Optional[str] = None,
+) -> str:
+    """Render a plan to ``todo.md`` and return the file path."""
+    manager = _get_manager(task_plan)
+    if todo_md_path is None:
+        todo_md_path = manager.todo_md_path
+    completion = manager.compute_overall_completion()
+
+    content = _render_todo_md(task_plan, completion)
+    _write_todo_md(todo_md_path, content)
+    _index_md_offsets(manager, task_plan, content, todo_md_path)
+
+    logger.info("Generated todo.md at %s", todo_md_path)
+    if logger.isEnabledFor(logging.DEBUG):
+        for line in content.splitlines()[:10]:
+            logger.debug("%s", line)
+    return todo_md_path
+
+
+def update_task_completion(
+    task_plan: TaskPlan,
+    task_id: str,
+    completed: bool = True,
+    todo_md_path: Optional[str] = None,
+) -> Optional[str]:
+    """Toggle a task's completion and rewrite ``todo.md``.
+
+    Args:
+        task_plan: The plan holding the task.
+        task_id: Id of the task to update.
+        completed: New completion state.
+        todo_md_path: Destination file; defaults to
+            ``<cwd>/todo.md``.
+
+    Returns:
+        The path written, or None when the task id is unknown.
+    """
+    logger.debug(
+        "Updating task %s to completed=%s", task_id, completed
+    )
+    manager = _get_manager(task_plan)
+    if todo_md_path is None:
+        todo_md_path = manager.todo_md_path
+    entry = manager.get_task(task_id)
+    if entry is None:
+        logger.warning(
+            "Failed to update task %s: not found", task_id
+        )
+        return None
+
+    phase_idx, task = entry
+    logger.debug(
+        "Found task '%s' in phase %d (agent=%s)",
+        task.description,
+        phase_idx + 1,
+        task.agent,
+    )
+    if not manager.set_completed(phase_idx, task, completed):
+        # Idempotent update: state (and therefore the file) is
+        # already current, so skip the render and write.
+        logger.debug(
+            "Task %s already completed=%s; nothing to write",
+            task_id,
+            completed,
+        )
+        return todo_md_path
+    if manager._check_phase_completion(phase_idx):
+        logger.info("Phase %d complete", phase_idx + 1)
+    if manager._check_project_completion():
+        logger.info(
+            "Project '%s' complete!", task_plan.project_name
+        )
+
+    completion = manager.compute_overall_completion()
+    task_plan.overall_completion = completion
+
+    # One checkbox plus the footer is the whole delta; patch
+    # those bytes in place when the last render's offsets are
+    # still valid, re-rendering only when they are not.
+    if not _patch_todo_md(
+        manager, todo_md_path, task, completion
+    ):
+        content = _render_todo_md(task_plan, completion)
+        _write_todo_md(todo_md_path, content)
+        _index_md_offsets(
+            manager, task_plan, content, todo_md_path
+        )
+        if logger.isEnabledFor(logging.DEBUG):
+            for line in content.splitlines()[:10]:
+                logger.debug("%s", line)
+
+    logger.info(
+        "Updated task %s -> completed=%s (%.1f%% overall)",
+        task_id,
+        completed,
+        completion,
+    )
+    return todo_md_path
+
+
+# The verbose variant only differed in extra narration, which
+# now lives at DEBUG level in the one implementation; enable it
+# via logging configuration rather than a separate entry point.
+update_task_completion_with_logging = update_task_completion
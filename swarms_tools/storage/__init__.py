@@ -0,0 +1,3 @@
+from swarms_tools.storage.spfs import SpfsStorageClient
+
+__all__ = ["SpfsStorageClient"]
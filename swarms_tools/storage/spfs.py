@@ -0,0 +1,331 @@
+"""SPFS (IPFS-compatible) storage client.
+
+Thin wrapper over an SPFS/IPFS HTTP API node exposing ``add`` and
+``cat`` as ``put``/``get`` (plus async variants). The underlying
+``httpx`` clients are shared process-wide per ``(base_url,
+timeout)`` with HTTP/2 and keepalive enabled, so constructing a
+client per operation — a common caller pattern — reuses one warm
+connection pool instead of paying a TCP+TLS handshake on every
+call, and concurrent requests multiplex over a single connection.
+"""
+
+import asyncio
+import os
+import threading
+from collections import OrderedDict
+from typing import (
+    IO,
+    AsyncIterator,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+import httpx
+
+try:
+    # ~5x faster than stdlib json and parses bytes without a
+    # UTF-8 decode pass; worth having on the per-blob put path
+    # once puts are batched.
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover
+    from json import loads as _json_loads
+
+_DEFAULT_BASE_URL = "http://127.0.0.1:5001/api/v0"
+
+_LIMITS = httpx.Limits(
+    max_keepalive_connections=32, max_connections=128
+)
+
+
+# Shared pools keyed by (base_url, timeout). Plain dicts rather
+# than lru_cache: a closing client must be able to evict just its
+# own entry, where cache_clear would orphan every other key's
+# still-open pool.
+_CLIENTS: Dict[
+    Tuple[str, Optional[float]], httpx.Client
+] = {}
+_ASYNC_CLIENTS: Dict[
+    Tuple[str, Optional[float]], httpx.AsyncClient
+] = {}
+
+
+def _shared_client(
+    base_url: str, timeout: Optional[float]
+) -> httpx.Client:
+    """One sync client per (base_url, timeout), built lazily."""
+    key = (base_url, timeout)
+    client = _CLIENTS.get(key)
+    if client is None:
+        client = httpx.Client(
+            base_url=base_url,
+            timeout=timeout,
+            http2=True,
+            limits=_LIMITS,
+        )
+        _CLIENTS[key] = client
+    return client
+
+
+def _shared_async_client(
+    base_url: str, timeout: Optional[float]
+) -> httpx.AsyncClient:
+    """One async client per (base_url, timeout), built lazily."""
+    key = (base_url, timeout)
+    client = _ASYNC_CLIENTS.get(key)
+    if client is None:
+        client = httpx.AsyncClient(
+            base_url=base_url,
+            timeout=timeout,
+            http2=True,
+            limits=_LIMITS,
+        )
+        _ASYNC_CLIENTS[key] = client
+    return client
+
+
+class _SizeLRU:
+    """Byte-budgeted LRU mapping of CID -> blob.
+
+    Plain dict-of-entries would count items, not bytes; here
+    each entry is weighed by ``len`` and the least recently
+    used CIDs are evicted once the total exceeds ``max_bytes``.
+    Thread-safe; the lock is never held across I/O.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._total = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: str, value: bytes) -> None:
+        if len(value) > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._total -= len(old)
+            self._entries[key] = value
+            self._total += len(value)
+            while self._total > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._total -= len(evicted)
+
+
+class SpfsStorageClient:
+    """Store and fetch content-addressed blobs on an SPFS node.
+
+    Args:
+        base_url: SPFS HTTP API root; defaults to the
+            ``SPFS_API_URL`` env var or the local node.
+        timeout: Request timeout in seconds; None disables it.
+        cache_bytes: Byte budget for the client-side CID cache
+            used by ``get``/``aget``; 0 disables caching. CIDs
+            are content-addressed, so cached blobs can never go
+            stale.
+
+    Example:
+        >>> with SpfsStorageClient() as client:
+        ...     cid = client.put(b"world", file_name="hello")
+        ...     assert client.get(cid) == b"world"
+    """
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        timeout: Optional[float] = 5.0,
+        cache_bytes: int = 256 * 1024 * 1024,
+    ):
+        self.base_url = base_url or os.getenv(
+            "SPFS_API_URL", _DEFAULT_BASE_URL
+        )
+        self.timeout = timeout
+        # Shared pools: instances delegate to the cached clients
+        # and must not close them in __exit__.
+        self._client = _shared_client(
+            self.base_url, self.timeout
+        )
+        self._async_client = _shared_async_client(
+            self.base_url, self.timeout
+        )
+        self._cache = (
+            _SizeLRU(cache_bytes) if cache_bytes > 0 else None
+        )
+
+    def put(
+        self,
+        value: Union[bytes, IO[bytes]],
+        file_name: str,
+    ) -> str:
+        """Upload ``value`` and return its CID."""
+        response = self._client.post(
+            "/add",
+            files={
+                "file": (
+                    file_name,
+                    value,
+                    "application/octet-stream",
+                )
+            },
+        )
+        response.raise_for_status()
+        return _json_loads(response.content)["Hash"]
+
+    async def aput(
+        self,
+        value: Union[bytes, IO[bytes]],
+        file_name: str,
+    ) -> str:
+        """Async variant of :meth:`put`."""
+        response = await self._async_client.post(
+            "/add",
+            files={
+                "file": (
+                    file_name,
+                    value,
+                    "application/octet-stream",
+                )
+            },
+        )
+        response.raise_for_status()
+        return _json_loads(response.content)["Hash"]
+
+    async def aput_many(
+        self,
+        values: Sequence[Union[bytes, IO[bytes]]],
+        file_names: Optional[Sequence[str]] = None,
+        concurrency: int = 32,
+    ) -> List[str]:
+        """Upload many blobs concurrently; returns their CIDs.
+
+        Requests fan out under a bounded semaphore and multiplex
+        over the shared HTTP/2 connection, so N small uploads
+        cost roughly one round-trip instead of N.
+        """
+        if file_names is None:
+            file_names = [
+                f"blob-{i}" for i in range(len(values))
+            ]
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def one(
+            value: Union[bytes, IO[bytes]], name: str
+        ) -> str:
+            async with semaphore:
+                return await self.aput(value, file_name=name)
+
+        return await asyncio.gather(
+            *map(one, values, file_names)
+        )
+
+    async def aget_many(
+        self,
+        keys: Sequence[str],
+        concurrency: int = 32,
+    ) -> List[bytes]:
+        """Fetch many CIDs concurrently, in input order."""
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def one(key: str) -> bytes:
+            async with semaphore:
+                return await self.aget(key)
+
+        return await asyncio.gather(*map(one, keys))
+
+    def stream_get(
+        self, key: str, chunk_size: int = 65536
+    ) -> Iterator[bytes]:
+        """Yield the blob under CID ``key`` in chunks.
+
+        Constant-memory alternative to :meth:`get`; pairs
+        directly with ``shutil.copyfileobj``-style consumers.
+        """
+        with self._client.stream(
+            "POST", "/cat", params={"arg": key}
+        ) as response:
+            response.raise_for_status()
+            yield from response.iter_bytes(chunk_size)
+
+    async def astream_get(
+        self, key: str, chunk_size: int = 65536
+    ) -> AsyncIterator[bytes]:
+        """Async variant of :meth:`stream_get`."""
+        async with self._async_client.stream(
+            "POST", "/cat", params={"arg": key}
+        ) as response:
+            response.raise_for_status()
+            async for chunk in response.aiter_bytes(chunk_size):
+                yield chunk
+
+    def get(self, key: str) -> bytes:
+        """Fetch the blob stored under CID ``key``."""
+        if self._cache is not None:
+            cached = self._cache.get(key)
+            if cached is not None:
+                return cached
+        content = b"".join(self.stream_get(key))
+        if self._cache is not None:
+            self._cache.put(key, content)
+        return content
+
+    async def aget(self, key: str) -> bytes:
+        """Async variant of :meth:`get`."""
+        if self._cache is not None:
+            cached = self._cache.get(key)
+            if cached is not None:
+                return cached
+        chunks = []
+        async for chunk in self.astream_get(key):
+            chunks.append(chunk)
+        content = b"".join(chunks)
+        if self._cache is not None:
+            self._cache.put(key, content)
+        return content
+
+    async def aclose(self) -> None:
+        """Close the shared async client for this endpoint.
+
+        Evicts and closes only this instance's ``(base_url,
+        timeout)`` pool; pools for other endpoints stay open and
+        registered. The pool is still shared with every other
+        instance pointing at the same node, so only call when
+        done with the endpoint. httpx's async client only has
+        ``aclose`` — there is no async ``close`` — so this is
+        the one canonical spelling.
+        """
+        key = (self.base_url, self.timeout)
+        if _ASYNC_CLIENTS.get(key) is self._async_client:
+            del _ASYNC_CLIENTS[key]
+        await self._async_client.aclose()
+
+    # Backwards-compatible alias; callers were written against
+    # ``await client.close()``.
+    close = aclose
+
+    async def __aenter__(self) -> "SpfsStorageClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        # The pooled clients outlive the instance by design;
+        # call aclose() explicitly at process shutdown.
+        return None
+
+    def __enter__(self) -> "SpfsStorageClient":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        # Same contract as __aexit__: leaves the shared pools
+        # open for other instances.
+        return None
@@ -2,9 +2,13 @@
 
 import orjson
 import asyncio
-import aiohttp
-from datetime import datetime
-from unittest.mock import patch, MagicMock
+import contextlib
+import contextvars
+import os
+import sys
+import time
+import types
+from unittest.mock import patch
 from swarms_tools.finance.jupiter_tools import (
     jupiter_fetch_token_by_mint_address,
     jupiter_fetch_token_by_mint_address_async,
@@ -14,6 +18,34 @@ from swarms_tools.finance.jupiter_tools import (
     jupiter_get_token_prices_async,
 )
 
+# Stand-in for aiohttp.ClientError: the tests only need *an*
+# exception type to thread through the mocked session, and
+# importing aiohttp (plus multidict/yarl/attrs) just for that
+# adds tens of milliseconds to cold startup.
+class ClientError(Exception):
+    pass
+
+
+# Per-test status lines go to stdout immediately only when
+# SWARMS_TEST_VERBOSE=1; otherwise they are buffered and flushed
+# in one write at the end, turning N line-flush syscalls into 1.
+_VERBOSE = os.environ.get("SWARMS_TEST_VERBOSE") == "1"
+_LINES = []
+
+
+def _emit(line):
+    if _VERBOSE:
+        print(line)
+    else:
+        _LINES.append(line)
+
+
+def _flush_lines():
+    if _LINES:
+        sys.stdout.write("\n".join(_LINES) + "\n")
+        _LINES.clear()
+
+
 # Test Results Storage
 test_results = {
     "timestamp": "",
@@ -23,8 +55,10 @@ test_results = {
     "results": [],
 }
 
-# Sample test data
-SAMPLE_TOKEN = {
+# Sample test data. Read-only views: the same dicts are handed
+# to every test, so freezing them guards against cross-test
+# mutation and skips per-test copies.
+SAMPLE_TOKEN = types.MappingProxyType({
     "address": "So11111111111111111111111111111111111111112",
     "chainId": 101,
     "decimals": 9,
@@ -33,9 +67,9 @@ SAMPLE_TOKEN = {
     "logoURI": (
         "https://raw.githubusercontent.com/solana-labs/token-list/main/assets/mainnet/So11111111111111111111111111111111111111112/logo.png"
     ),
-}
+})
 
-SAMPLE_PRICES = {
+SAMPLE_PRICES = types.MappingProxyType({
     "data": {
         "So11111111111111111111111111111111111111112": {
             "id": "So11111111111111111111111111111111111111112",
@@ -45,98 +79,273 @@ SAMPLE_PRICES = {
             "price": 100.50,
         }
     }
-}
+})
+
+# Results are written into a preallocated [None] * N list by
+# slot index instead of appended: no list reallocation while
+# recording, and orjson serializes one contiguous, fully built
+# list of uniform dicts at the end. Slots are claimed in
+# invocation order, so the report ordering is unchanged.
+_slot_counter = [0]
+
+# Flat counters mutated on the hot path — an index store beats
+# three dict-key hashes per test — and folded back into
+# test_results once per run. Layout: [total, passed, failed].
+_counters = [0, 0, 0]
+
+
+def _claim_slot():
+    slot = _slot_counter[0]
+    _slot_counter[0] = slot + 1
+    results = test_results["results"]
+    if slot >= len(results):
+        # Tests invoked outside run_all_tests (no preallocation).
+        results.append(None)
+    return slot
+
+
+def _record(test_name, slot, outcome):
+    """Record one test outcome; the single recorder for both the
+    sync wrappers and the gathered async results.
+
+    ``outcome`` is an exception instance for a failure, anything
+    else for a pass — the same convention gather's
+    ``return_exceptions=True`` produces.
+    """
+    _counters[0] += 1
+    if isinstance(outcome, BaseException):
+        _counters[2] += 1
+        test_results["results"][slot] = {
+            "test_name": test_name,
+            "status": "failed",
+            "error": str(outcome),
+        }
+        _emit(f"❌ {test_name} failed: {str(outcome)}")
+    else:
+        _counters[1] += 1
+        test_results["results"][slot] = {
+            "test_name": test_name,
+            "status": "passed",
+            "error": None,
+        }
+        _emit(f"✅ {test_name} passed")
 
 
 def run_test(func):
     """Decorator to run tests and record results."""
+    _test_name = func.__name__
 
     def wrapper(*args, **kwargs):
-        test_results["total_tests"] += 1
-        test_name = func.__name__
+        slot = _claim_slot()
         try:
-            func(*args, **kwargs)
-            test_results["passed"] += 1
-            test_results["results"].append(
-                {
-                    "test_name": test_name,
-                    "status": "passed",
-                    "error": None,
-                }
-            )
-            print(f"✅ {test_name} passed")
+            outcome = func(*args, **kwargs)
         except Exception as e:
-            test_results["failed"] += 1
-            test_results["results"].append(
-                {
-                    "test_name": test_name,
-                    "status": "failed",
-                    "error": str(e),
-                }
-            )
-            print(f"❌ {test_name} failed: {str(e)}")
+            outcome = e
+        _record(_test_name, slot, outcome)
 
     return wrapper
 
 
+# One event loop for the whole suite: asyncio.run builds and
+# tears down a loop per call, which dominates runtime when every
+# test body is mocked and returns instantly.
+_SHARED_LOOP = None
+
+
+def _get_shared_loop():
+    """Return the suite-wide event loop, creating it lazily."""
+    global _SHARED_LOOP
+    if _SHARED_LOOP is None or _SHARED_LOOP.is_closed():
+        _SHARED_LOOP = asyncio.new_event_loop()
+        asyncio.set_event_loop(_SHARED_LOOP)
+        # Eager tasks (3.12+) run coroutines synchronously until
+        # their first suspension — and these mocked tests never
+        # suspend, so they complete without touching the
+        # selector at all.
+        if hasattr(asyncio, "eager_task_factory"):
+            _SHARED_LOOP.set_task_factory(
+                asyncio.eager_task_factory
+            )
+    return _SHARED_LOOP
+
+
+# Async tests queued for one concurrent run: (name, slot,
+# factory) triples registered by the decorator, executed
+# together by _run_pending_async.
+_PENDING_ASYNC = []
+
+
 def run_async_test(func):
-    """Decorator to run async tests and record results."""
+    """Decorator registering async tests for a gathered run."""
 
     def wrapper(*args, **kwargs):
-        test_results["total_tests"] += 1
-        test_name = func.__name__
-        try:
-            asyncio.run(func(*args, **kwargs))
-            test_results["passed"] += 1
-            test_results["results"].append(
-                {
-                    "test_name": test_name,
-                    "status": "passed",
-                    "error": None,
-                }
-            )
-            print(f"✅ {test_name} passed")
-        except Exception as e:
-            test_results["failed"] += 1
-            test_results["results"].append(
-                {
-                    "test_name": test_name,
-                    "status": "failed",
-                    "error": str(e),
-                }
+        _PENDING_ASYNC.append(
+            (
+                func.__name__,
+                _claim_slot(),
+                lambda: func(*args, **kwargs),
             )
-            print(f"❌ {test_name} failed: {str(e)}")
+        )
 
     return wrapper
 
 
-async def create_mock_session():
-    """Create a mock aiohttp session for testing."""
-    mock = MagicMock()
-    mock.__aenter__.return_value = mock
-    mock.raise_for_status = MagicMock()
-    return mock
+def _run_pending_async():
+    """Run every queued async test concurrently and record results.
+
+    The tests only await mocks, so gathering them in one
+    run_until_complete pass replaces N sequential loop entries
+    with a single scheduling pass; return_exceptions keeps one
+    failure from cancelling the rest.
+    """
+    if not _PENDING_ASYNC:
+        return
+    keyed = [(name, slot) for name, slot, _ in _PENDING_ASYNC]
+    loop = _get_shared_loop()
+
+    async def _drive():
+        # Explicit create_task inside the running loop: each
+        # test goes through the loop's task factory, so with
+        # eager tasks (chunk8-16) a never-suspending test runs
+        # to completion right here, before gather even awaits.
+        tasks = [
+            loop.create_task(factory())
+            for _, _, factory in _PENDING_ASYNC
+        ]
+        return await asyncio.gather(
+            *tasks, return_exceptions=True
+        )
+
+    outcomes = loop.run_until_complete(_drive())
+    _PENDING_ASYNC.clear()
+    for (test_name, slot), outcome in zip(keyed, outcomes):
+        _record(test_name, slot, outcome)
+
+
+# Patch targets installed once for the whole suite: per-test
+# `with patch(...)` re-resolves the dotted path and swaps the
+# attribute in and out on every test, which is pure overhead
+# when the bodies run in microseconds. Tests configure
+# return_value/side_effect on these preinstalled mocks instead.
+_patch_stack = contextlib.ExitStack()
+mock_get_session = None
+mock_fetch_token_async = None
+mock_get_prices_async = None
+mock_fetch_tradable_async = None
+
+
+def _install_patches():
+    """Enter the suite-wide patches and expose their mocks."""
+    global mock_get_session, mock_fetch_token_async
+    global mock_get_prices_async, mock_fetch_tradable_async
+    enter = _patch_stack.enter_context
+    mock_get_session = enter(
+        patch(
+            "swarms_tools.finance.jupiter_tools.get_aiohttp_session"
+        )
+    )
+    mock_get_session.side_effect = _MOCK_SESSION.get
+    mock_fetch_token_async = enter(
+        patch(
+            "swarms_tools.finance.jupiter_tools.jupiter_fetch_token_by_mint_address_async"
+        )
+    )
+    mock_get_prices_async = enter(
+        patch(
+            "swarms_tools.finance.jupiter_tools.jupiter_get_token_prices_async"
+        )
+    )
+    mock_fetch_tradable_async = enter(
+        patch(
+            "swarms_tools.finance.jupiter_tools.jupiter_fetch_tradable_tokens_async"
+        )
+    )
+
+
+class _MockSession:
+    """Lightweight stand-in for an aiohttp session and response.
+
+    Plays both roles, like the mock tree it replaces: ``get``
+    returns ``self`` synchronously (matching aiohttp, where
+    ``session.get(...)`` hands back the request context manager)
+    and the async context manager yields ``self`` as the
+    response. Real methods on a slotted class — no child-mock
+    fabrication or call recording per attribute access.
+    """
+
+    __slots__ = ("_payload", "_error")
+
+    def __init__(self, payload):
+        self._payload = payload
+        self._error = None
+
+    def get(self, url, **kwargs):
+        return self
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+    async def json(self):
+        return self._payload
+
+    def raise_for_status(self):
+        if self._error is not None:
+            raise self._error
+
+
+def create_mock_session():
+    """Create a mock aiohttp session for testing.
+
+    Synchronous on purpose: the body never awaits, so an async
+    def only added a coroutine object and frame per call.
+    """
+    return _MockSession(SAMPLE_TOKEN)
+
+
+# Each test's session rides in a ContextVar rather than a shared
+# module global: tasks snapshot the context when created, so the
+# child requests a test fans out via gather keep resolving the
+# session *their* test installed even while sibling tests (which
+# run interleaved on the same loop) install their own. A shared
+# session broke exactly that way on 3.10/3.11, where tasks are
+# not eager and the siblings run before the children do.
+_MOCK_SESSION = contextvars.ContextVar(
+    "jupiter_mock_session", default=None
+)
+
+
+@contextlib.contextmanager
+def _mock_json(payload):
+    """Route the session getter to a fresh mock session with
+    ``payload`` as its ``json()`` body.
+
+    Folds the four setup lines duplicated across the async tests
+    into one helper.
+    """
+    mock_session = _MockSession(payload)
+    token = _MOCK_SESSION.set(mock_session)
+    try:
+        yield mock_session
+    finally:
+        _MOCK_SESSION.reset(token)
 
 
 @run_async_test
 async def test_fetch_token_by_mint_address_async():
     """Test fetching token information by mint address asynchronously."""
-    mock_session = await create_mock_session()
     mint_address = "So11111111111111111111111111111111111111112"
 
-    with patch(
-        "swarms_tools.finance.jupiter_tools.get_aiohttp_session"
-    ) as mock_get_session:
-        mock_get_session.return_value = mock_session
-        mock_session.json.return_value = SAMPLE_TOKEN
-
+    with _mock_json(SAMPLE_TOKEN):
         result = await jupiter_fetch_token_by_mint_address_async(
             mint_address
         )
 
-        assert result == SAMPLE_TOKEN
-        assert result["symbol"] == "SOL"
-        assert result["address"] == mint_address
+    assert result == SAMPLE_TOKEN
+    assert result["symbol"] == "SOL"
+    assert result["address"] == mint_address
 
 
 @run_test
@@ -144,41 +353,32 @@ def test_fetch_token_by_mint_address():
     """Test the synchronous wrapper for fetching token information."""
     mint_address = "So11111111111111111111111111111111111111112"
 
-    with patch(
-        "swarms_tools.finance.jupiter_tools.jupiter_fetch_token_by_mint_address_async"
-    ) as mock_async:
-        mock_async.return_value = SAMPLE_TOKEN
+    mock_fetch_token_async.return_value = SAMPLE_TOKEN
 
-        result = jupiter_fetch_token_by_mint_address(mint_address)
+    result = jupiter_fetch_token_by_mint_address(mint_address)
 
-        assert result == SAMPLE_TOKEN
+    assert result == SAMPLE_TOKEN
 
 
 @run_async_test
 async def test_get_token_prices_async():
     """Test getting token prices asynchronously with different parameter combinations."""
-    mock_session = await create_mock_session()
     token_ids = ["So11111111111111111111111111111111111111112"]
 
-    with patch(
-        "swarms_tools.finance.jupiter_tools.get_aiohttp_session"
-    ) as mock_get_session:
-        mock_get_session.return_value = mock_session
-        mock_session.json.return_value = SAMPLE_PRICES
-
-        # Test with single token ID
-        result = await jupiter_get_token_prices_async(token_ids[0])
-        assert result == SAMPLE_PRICES
-
-        # Test with list of token IDs
-        result = await jupiter_get_token_prices_async(token_ids)
-        assert result == SAMPLE_PRICES
-
-        # Test with vs_token parameter
-        result = await jupiter_get_token_prices_async(
-            token_ids, vs_token="USDC"
+    # Single id, list of ids, and vs_token are independent
+    # parameter variants against the same mock; issue them in
+    # one gather instead of three scheduler round-trips.
+    with _mock_json(SAMPLE_PRICES):
+        single, listed, versus = await asyncio.gather(
+            jupiter_get_token_prices_async(token_ids[0]),
+            jupiter_get_token_prices_async(token_ids),
+            jupiter_get_token_prices_async(
+                token_ids, vs_token="USDC"
+            ),
         )
-        assert result == SAMPLE_PRICES
+    assert single == SAMPLE_PRICES
+    assert listed == SAMPLE_PRICES
+    assert versus == SAMPLE_PRICES
 
 
 @run_async_test
@@ -199,27 +399,19 @@ def test_get_token_prices():
     """Test the synchronous wrapper for getting token prices."""
     token_ids = ["So11111111111111111111111111111111111111112"]
 
-    with patch(
-        "swarms_tools.finance.jupiter_tools.jupiter_get_token_prices_async"
-    ) as mock_async:
-        mock_async.return_value = SAMPLE_PRICES
-        result = jupiter_get_token_prices(token_ids)
-        assert result == SAMPLE_PRICES
+    mock_get_prices_async.return_value = SAMPLE_PRICES
+    result = jupiter_get_token_prices(token_ids)
+    assert result == SAMPLE_PRICES
 
 
 @run_async_test
 async def test_fetch_tradable_tokens_async():
     """Test fetching tradable tokens asynchronously."""
-    mock_session = await create_mock_session()
     sample_tradable_tokens = [SAMPLE_TOKEN]
 
-    with patch(
-        "swarms_tools.finance.jupiter_tools.get_aiohttp_session"
-    ) as mock_get_session:
-        mock_get_session.return_value = mock_session
-        mock_session.json.return_value = sample_tradable_tokens
+    with _mock_json(sample_tradable_tokens):
         result = await jupiter_fetch_tradable_tokens_async()
-        assert result == sample_tradable_tokens
+    assert result == sample_tradable_tokens
 
 
 @run_test
@@ -227,28 +419,20 @@ def test_fetch_tradable_tokens():
     """Test the synchronous wrapper for fetching tradable tokens."""
     sample_tradable_tokens = [SAMPLE_TOKEN]
 
-    with patch(
-        "swarms_tools.finance.jupiter_tools.jupiter_fetch_tradable_tokens_async"
-    ) as mock_async:
-        mock_async.return_value = sample_tradable_tokens
-        result = jupiter_fetch_tradable_tokens()
-        assert result == sample_tradable_tokens
+    mock_fetch_tradable_async.return_value = (
+        sample_tradable_tokens
+    )
+    result = jupiter_fetch_tradable_tokens()
+    assert result == sample_tradable_tokens
 
 
 @run_async_test
 async def test_api_error_handling():
     """Test error handling for API requests."""
-    mock_session = await create_mock_session()
     mint_address = "So11111111111111111111111111111111111111112"
 
-    with patch(
-        "swarms_tools.finance.jupiter_tools.get_aiohttp_session"
-    ) as mock_get_session:
-        mock_get_session.return_value = mock_session
-        mock_session.raise_for_status.side_effect = (
-            aiohttp.ClientError()
-        )
-
+    with _mock_json(SAMPLE_TOKEN) as mock_session:
+        mock_session._error = ClientError()
         try:
             await jupiter_fetch_token_by_mint_address_async(
                 mint_address
@@ -256,28 +440,78 @@ async def test_api_error_handling():
             raise AssertionError(
                 "Expected ClientError was not raised"
             )
-        except aiohttp.ClientError:
+        except ClientError:
             pass
 
 
+# Dispatch table: run_all_tests iterates this instead of eight
+# hand-written calls, and the suite's size is defined in one
+# place for the harness to pre-size against.
+_TESTS = (
+    test_fetch_token_by_mint_address_async,
+    test_fetch_token_by_mint_address,
+    test_get_token_prices_async,
+    test_get_token_prices_invalid_params,
+    test_get_token_prices,
+    test_fetch_tradable_tokens_async,
+    test_fetch_tradable_tokens,
+    test_api_error_handling,
+)
+
+
 def run_all_tests():
     """Run all tests and generate JSON report."""
-    test_results["timestamp"] = datetime.now().isoformat()
-
-    # Run all test functions
-    test_fetch_token_by_mint_address_async()
-    test_fetch_token_by_mint_address()
-    test_get_token_prices_async()
-    test_get_token_prices_invalid_params()
-    test_get_token_prices()
-    test_fetch_tradable_tokens_async()
-    test_fetch_tradable_tokens()
-    test_api_error_handling()
+    # uvloop's libuv-based loop sets up and dispatches callbacks
+    # roughly twice as fast as the stock selector loop, which is
+    # most of the cost of these sub-millisecond mocked tests.
+    # Optional: the stock loop is used when uvloop is absent.
+    try:
+        import uvloop
+
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
+    # time.strftime gives the same ISO-8601 shape without
+    # importing datetime or instantiating an object per run.
+    test_results["timestamp"] = time.strftime(
+        "%Y-%m-%dT%H:%M:%S"
+    )
+    test_results["results"] = [None] * len(_TESTS)
+    _slot_counter[0] = 0
+    _counters[:] = [0, 0, 0]
+
+    _install_patches()
+    # Run all test functions; async ones only register here and
+    # execute together in _run_pending_async.
+    try:
+        for test in _TESTS:
+            test()
+        _run_pending_async()
+    finally:
+        _patch_stack.close()
+        if _SHARED_LOOP is not None:
+            _SHARED_LOOP.close()
+        _flush_lines()
 
     # Generate report
+    # Fold the flat counters back into the report dict.
+    (
+        test_results["total_tests"],
+        test_results["passed"],
+        test_results["failed"],
+    ) = _counters
+
+    # orjson serializes to bytes in one C call; write them with a
+    # single binary write instead of streaming through a text
+    # wrapper (orjson has no dump(), only dumps()).
     report_path = "jupiter_test_report.json"
-    with open(report_path, "w") as f:
-        orjson.dump(test_results, f, option=orjson.OPT_INDENT_2)
+    with open(report_path, "wb") as f:
+        f.write(
+            orjson.dumps(
+                test_results, option=orjson.OPT_INDENT_2
+            )
+        )
 
     print("\nTest Summary:")
     print(f"Total Tests: {test_results['total_tests']}")